@@ -11237,7 +11237,7 @@ def get_random_loading_content():
             
             # Get random question (no context filtering)
             pipeline = [
-                {'$match': {'active': True}},
+                {'$match': {'active': {'$ne': False}}},
             ]
             if exclude_list:
                 pipeline[0]['$match']['question_id'] = {'$nin': exclude_list}
@@ -11264,7 +11264,7 @@ def get_random_loading_content():
             facts_col = db['loading_facts']
             
             pipeline = [
-                {'$match': {'active': True}},
+                {'$match': {'active': {'$ne': False}}},
             ]
             if exclude_list:
                 pipeline[0]['$match']['fact_id'] = {'$nin': exclude_list}
@@ -11379,7 +11379,7 @@ def get_batch_loading_content():
             questions_col = db['loading_questions']
             q_count = count if content_type == 'question' else count // 2 + 1
             q_docs = list(questions_col.aggregate([
-                {'$match': {'active': True}},
+                {'$match': {'active': {'$ne': False}}},
                 {'$sample': {'size': q_count}}
             ]))
             for doc in q_docs:
@@ -11398,7 +11398,7 @@ def get_batch_loading_content():
             facts_col = db['loading_facts']
             f_count = count if content_type == 'fact' else count // 2
             f_docs = list(facts_col.aggregate([
-                {'$match': {'active': True}},
+                {'$match': {'active': {'$ne': False}}},
                 {'$sample': {'size': f_count}}
             ]))
             for doc in f_docs:
@@ -1,35 +1,22 @@
 import pickle
 import os
+import copy
+import bisect
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import logging
-from domain_keywords import get_keywords_for_selection, get_advanced_keywords, get_all_keywords
+from domain_keywords import (
+    CATEGORY_KEYWORDS, DOMAIN_MAPPING,
+    get_keywords_for_selection, get_advanced_keywords, get_all_keywords
+)
 import json
-try:
-    # Prefer fuzzywuzzy if available (existing code expects this API)
-    from fuzzywuzzy import fuzz  # type: ignore
-except Exception:
-    try:
-        # rapidfuzz has a compatible API for ratio scoring
-        from rapidfuzz import fuzz  # type: ignore
-    except Exception:
-        # Fallback: lightweight implementation using difflib (returns 0-100 int)
-        import difflib
-
-        class _SimpleFuzz:
-            @staticmethod
-            def ratio(a, b):
-                try:
-                    if a is None or b is None:
-                        return 0
-                    a_s = str(a)
-                    b_s = str(b)
-                    return int(round(difflib.SequenceMatcher(None, a_s, b_s).ratio() * 100))
-                except Exception:
-                    return 0
-
-        fuzz = _SimpleFuzz()
+import ahocorasick
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -66,6 +53,14 @@ SCORING_WEIGHTS = {
     'achievements_certifications': 0.10     # 10% - Certifications, awards, achievements
 }
 
+# Number of recent prediction results kept for identical re-requests (refreshes, polling)
+PREDICTION_CACHE_SIZE = 1024
+
+# Component order used for vectorized blending (experience pre-scaled to 0-100)
+BLEND_COMPONENTS = ('academics', 'skills', 'projects', 'dsa', 'experience', 'achievements_certifications')
+_BLEND_WEIGHT_TUPLE = tuple(SCORING_WEIGHTS[c] for c in BLEND_COMPONENTS)
+_BLEND_WEIGHTS = np.array(_BLEND_WEIGHT_TUPLE, dtype=np.float64)
+
 # Score normalization ranges
 SCORE_RANGES = {
     'academics': (0, 100),          # CGPA * 10, 10th%, 12th% averaged
@@ -77,15 +72,41 @@ SCORE_RANGES = {
     'achievements': (0, 100)        # Achievement score
 }
 
+# Raw _blend_scores inputs with their valid ranges, and the projection onto
+# BLEND_COMPONENTS (experience x10 to 0-100, certifications/achievements averaged)
+BLEND_INPUTS = ('academics', 'skills', 'projects', 'dsa', 'experience', 'certifications', 'achievements')
+_BLEND_INPUT_MINS = np.array([SCORE_RANGES[k][0] for k in BLEND_INPUTS], dtype=np.float64)
+_BLEND_INPUT_MAXS = np.array([SCORE_RANGES[k][1] for k in BLEND_INPUTS], dtype=np.float64)
+_BLEND_PROJECTION = np.array([
+    [1, 0, 0, 0, 0, 0],     # academics
+    [0, 1, 0, 0, 0, 0],     # skills
+    [0, 0, 1, 0, 0, 0],     # projects
+    [0, 0, 0, 1, 0, 0],     # dsa
+    [0, 0, 0, 0, 10, 0],    # experience (0-10 -> 0-100)
+    [0, 0, 0, 0, 0, 0.5],   # certifications
+    [0, 0, 0, 0, 0, 0.5],   # achievements
+], dtype=np.float64)
+
+# Rule-based fallback blend (used when the ML model is unavailable)
+FALLBACK_COMPONENTS = ('academics', 'skills', 'projects', 'experience', 'achievements_certifications')
+_FALLBACK_WEIGHTS = np.array([0.30, 0.20, 0.20, 0.15, 0.15], dtype=np.float64)
+
 # Eligibility threshold
 PLACEMENT_ELIGIBILITY_THRESHOLD = 50  # Minimum score for placement eligibility
 
+# Prediction confidence lookup, indexed by ML score in hundredths (0.00-100.00).
+# Higher confidence for extreme scores, lower for middle scores.
+_CONFIDENCE_TABLE = tuple(
+    95.0 if s >= 8000 or s <= 2000 else (85.0 if s >= 6000 or s <= 4000 else 75.0)
+    for s in range(10001)
+)
+
 # ============================================================================
 # FUZZY MATCHING CONFIGURATION
 # ============================================================================
 
-# Fuzzy matching threshold (0-100, higher = stricter matching)
-FUZZY_MATCH_THRESHOLD = 80  # 80% similarity required for fuzzy match
+# Fuzzy matching threshold (Indel similarity 0-1, higher = stricter matching)
+STRICT_FUZZY_MATCH_THRESHOLD = 0.85  # 85% similarity required (_find_skill_match_strict)
 
 # Comprehensive skill synonyms and variations
 SKILL_SYNONYMS = {
@@ -206,6 +227,326 @@ for canonical, synonyms in SKILL_SYNONYMS.items():
     for synonym in synonyms:
         SYNONYM_TO_CANONICAL[synonym.lower()] = canonical
 
+# Characters removed when normalizing skills/keywords for comparison
+_SKILL_STRIP = str.maketrans('', '', '.-_ ')
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_skill(skill: str) -> str:
+    """Get canonical form of a skill (handles synonyms)"""
+    skill_lower = skill.lower().strip()
+    
+    # Remove common punctuation and normalize
+    skill_normalized = skill_lower.translate(_SKILL_STRIP)
+    
+    # Check if it's a known synonym
+    if skill_normalized in SYNONYM_TO_CANONICAL:
+        return SYNONYM_TO_CANONICAL[skill_normalized]
+    
+    # Also check original (with spaces)
+    if skill_lower in SYNONYM_TO_CANONICAL:
+        return SYNONYM_TO_CANONICAL[skill_lower]
+    
+    # Return normalized form if not found
+    return skill_normalized
+
+
+class _KeywordIndex:
+    """
+    Matching tables for one keyword list, built once and shared across requests.
+    
+    - keywords: the lowercase keywords, in list order
+    - entries: (keyword, normalized keyword, canonical keyword) in list order
+    - exact: normalized keyword -> first keyword with that normalized form
+    - canonical: canonical keyword -> position of the first keyword with that form
+    - automaton: Aho-Corasick automaton over normalized keywords (>=4 chars),
+      finding every keyword contained in a skill in one pass; each value holds
+      the keyword position and the longest skill length it may match
+    - by_length / normalized_by_length / lengths: keyword positions, normalized
+      keywords and their lengths sorted by length, so the skill-inside-keyword
+      check only visits keywords that can satisfy the 1.5x length-ratio rule
+    - trigrams: every character trigram of the normalized keywords (>=4 chars);
+      a skill sharing none of them cannot substring-match any keyword
+    """
+    
+    __slots__ = ('keywords', 'entries', 'exact', 'canonical', 'automaton',
+                 'by_length', 'normalized_by_length', 'lengths', 'trigrams')
+    
+    def __init__(self, keywords_lower):
+        self.keywords = tuple(keywords_lower)
+        self.entries = tuple(
+            (keyword, keyword.translate(_SKILL_STRIP), _canonical_skill(keyword))
+            for keyword in keywords_lower
+        )
+        
+        self.exact = {}
+        self.canonical = {}
+        for position, (keyword, keyword_normalized, keyword_canonical) in enumerate(self.entries):
+            self.exact.setdefault(keyword_normalized, keyword)
+            self.canonical.setdefault(keyword_canonical, position)
+        
+        self.automaton = None
+        for position, (_, keyword_normalized, _) in enumerate(self.entries):
+            if len(keyword_normalized) >= 4 and (self.automaton is None or keyword_normalized not in self.automaton):
+                if self.automaton is None:
+                    self.automaton = ahocorasick.Automaton()
+                # Integer bound for the 1.5x rule, so matching needs no float math
+                self.automaton.add_word(keyword_normalized, (position, int(len(keyword_normalized) * 1.5)))
+        if self.automaton is not None:
+            self.automaton.make_automaton()
+        
+        self.by_length = tuple(sorted(range(len(self.entries)), key=lambda i: len(self.entries[i][1])))
+        self.normalized_by_length = tuple(self.entries[i][1] for i in self.by_length)
+        self.lengths = [len(keyword_normalized) for keyword_normalized in self.normalized_by_length]
+        
+        self.trigrams = frozenset(
+            keyword_normalized[i:i + 3]
+            for _, keyword_normalized, _ in self.entries if len(keyword_normalized) >= 4
+            for i in range(len(keyword_normalized) - 2)
+        )
+    
+    def substring_position(self, skill_normalized: str, before: Optional[int] = None):
+        """
+        Position of the first keyword that substring-matches the skill, or None.
+        
+        A keyword (>=4 chars) inside the skill, or the skill (>=4 chars) inside
+        a keyword, counts only when the longer string is at most 1.5x the shorter.
+        Only positions strictly below ``before`` are considered when it is given.
+        """
+        skill_len = len(skill_normalized)
+        best = None
+        if skill_len < 4 or before == 0:
+            return best
+        
+        # Prescreen: any substring match shares at least one trigram with a keyword
+        if self.trigrams.isdisjoint(skill_normalized[i:i + 3] for i in range(skill_len - 2)):
+            return best
+        
+        # Keyword inside skill: one automaton pass reports every contained keyword
+        if self.automaton is not None:
+            for _, (position, max_skill_len) in self.automaton.iter(skill_normalized):
+                if skill_len <= max_skill_len and (best is None or position < best):
+                    best = position
+        
+        # Skill inside a longer keyword of acceptable length (the length window
+        # is the cheap prefilter; containment is only tested inside it)
+        bound = best if best is not None else before
+        lo = bisect.bisect_right(self.lengths, skill_len)
+        hi = bisect.bisect_right(self.lengths, skill_len * 1.5)
+        for position, keyword_normalized in zip(self.by_length[lo:hi], self.normalized_by_length[lo:hi]):
+            if (bound is None or position < bound) and skill_normalized in keyword_normalized:
+                best = bound = position
+        
+        if best is not None and before is not None and best >= before:
+            return None
+        return best
+
+
+@functools.lru_cache(maxsize=64)
+def _prepare_keyword_index(keywords_lower: Tuple[str, ...]) -> _KeywordIndex:
+    """Build (or reuse) the matching tables for a keyword list"""
+    return _KeywordIndex(keywords_lower)
+
+
+# Number of (skill, keyword list) match results kept across requests
+SKILL_MATCH_CACHE_SIZE = 65536
+
+# (skill_lower, _KeywordIndex) -> final match result dict; oldest entries evicted first
+_SKILL_MATCH_CACHE = {}
+_SKILL_MATCH_CACHE_LOCK = threading.Lock()
+
+
+def _cached_skill_match(skill_lower: str, keyword_index: _KeywordIndex):
+    """Return a copy of a cached match result, or None"""
+    result = _SKILL_MATCH_CACHE.get((skill_lower, keyword_index))
+    return dict(result) if result is not None else None
+
+
+def _store_skill_match(skill_lower: str, keyword_index: _KeywordIndex, result: Dict[str, Any]):
+    """Cache a final match result for a skill against a keyword list"""
+    with _SKILL_MATCH_CACHE_LOCK:
+        _SKILL_MATCH_CACHE[(skill_lower, keyword_index)] = dict(result)
+        while len(_SKILL_MATCH_CACHE) > SKILL_MATCH_CACHE_SIZE:
+            del _SKILL_MATCH_CACHE[next(iter(_SKILL_MATCH_CACHE))]
+
+# ============================================================================
+# DOMAIN KEYWORD TABLES
+# ============================================================================
+
+def _build_keyword_bundle(keywords):
+    """Normalize a keyword list once for skill matching (lowercase, stripped)"""
+    return tuple(kw.lower().strip() for kw in keywords)
+
+# Precomputed matching keywords for every known domain/category ID
+DOMAIN_KEYWORD_BUNDLES = {
+    selected_id: _build_keyword_bundle(get_keywords_for_selection(selected_id))
+    for selected_id in (*CATEGORY_KEYWORDS, *DOMAIN_MAPPING)
+}
+DEFAULT_KEYWORD_BUNDLE = _build_keyword_bundle(get_advanced_keywords())
+
+# ============================================================================
+# PROJECT EVALUATION TABLES
+# ============================================================================
+
+# Technology categories with comprehensive tech lists
+TECH_CATEGORIES = {
+    'frontend': ['react', 'vue', 'angular', 'html', 'css', 'javascript', 'typescript', 
+                'jquery', 'bootstrap', 'tailwind', 'sass', 'webpack', 'next.js', 'nuxt'],
+    'backend': ['node.js', 'express', 'django', 'flask', 'spring', 'asp.net', 'php', 
+               'ruby', 'rails', 'fastapi', 'laravel', 'nest.js', 'koa'],
+    'database': ['mysql', 'postgresql', 'mongodb', 'sqlite', 'redis', 'oracle', 
+                'nosql', 'cassandra', 'dynamodb', 'mariadb', 'firebase'],
+    'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'heroku', 'netlify',
+             'vercel', 'digitalocean', 'cloud', 'serverless', 'lambda'],
+    'mobile': ['android', 'ios', 'react native', 'flutter', 'kotlin', 'swift',
+              'xamarin', 'ionic', 'cordova', 'mobile'],
+    'ai_ml': ['python', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 
+             'opencv', 'keras', 'machine learning', 'deep learning', 'nlp', 'cv'],
+    'tools': ['git', 'jenkins', 'ci/cd', 'testing', 'apis', 'rest', 'graphql',
+             'postman', 'swagger', 'junit', 'jest', 'pytest', 'selenium']
+}
+
+def _build_tech_automaton(tech_categories):
+    """
+    Flatten the category table into one Aho-Corasick automaton.
+    
+    Each technology maps to (tech, category bitmask, number of categories
+    listing it), so one scan yields both the categories hit and the tech count.
+    """
+    category_mask_by_tech = {}
+    for category_index, techs in enumerate(tech_categories.values()):
+        for tech in techs:
+            category_mask_by_tech[tech] = category_mask_by_tech.get(tech, 0) | (1 << category_index)
+    
+    automaton = ahocorasick.Automaton()
+    for tech, category_mask in category_mask_by_tech.items():
+        automaton.add_word(tech, (tech, category_mask, category_mask.bit_count()))
+    automaton.make_automaton()
+    return automaton
+
+_TECH_AUTOMATON = _build_tech_automaton(TECH_CATEGORIES)
+
+def _build_term_automaton(terms):
+    """Aho-Corasick automaton over a keyword list (each match yields the term)"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+def _has_any_term(automaton, text):
+    """Same as any(term in text); stops at the first match"""
+    return next(automaton.iter(text), None) is not None
+
+def _count_terms(automaton, text):
+    """Same as sum(1 for term in terms if term in text)"""
+    return len({term for _, term in automaton.iter(text)})
+
+# Title: domain-specific terms
+PROJECT_TITLE_DOMAIN_TERMS = (
+    'system', 'platform', 'application', 'tool', 'framework',
+    'dashboard', 'portal', 'analyzer', 'predictor', 'classifier',
+    'detector', 'generator', 'optimizer', 'manager', 'tracker'
+)
+# Title: technology mentions
+PROJECT_TITLE_TECH_TERMS = (
+    'web', 'mobile', 'ai', 'ml', 'data', 'cloud', 'iot',
+    'blockchain', 'android', 'react', 'python', 'java'
+)
+# Description: implementation detail indicators
+PROJECT_DETAIL_KEYWORDS = (
+    'implemented', 'developed', 'built', 'created', 'designed',
+    'integrated', 'deployed', 'optimized', 'features', 'functionality',
+    'database', 'api', 'interface', 'algorithm', 'architecture'
+)
+# Description: complexity indicators
+PROJECT_COMPLEXITY_TERMS = (
+    'authentication', 'authorization', 'security', 'encryption',
+    'real-time', 'websocket', 'microservice', 'distributed',
+    'scalable', 'performance', 'optimization', 'load balancing',
+    'caching', 'monitoring', 'logging', 'testing', 'deployment',
+    'ci/cd', 'pipeline', 'architecture', 'design pattern'
+)
+# Description: advanced implementation details
+PROJECT_ADVANCED_TERMS = ('algorithm', 'data structure', 'optimization', 'pattern')
+# Title + description: real-world application indicators
+PROJECT_PRACTICAL_TERMS = (
+    'business', 'commercial', 'enterprise', 'production',
+    'user', 'customer', 'client', 'industry', 'solution',
+    'problem solving', 'automation', 'efficiency', 'productivity'
+)
+# Title + description: domain-specific applications
+PROJECT_DOMAIN_APPS = (
+    'healthcare', 'finance', 'education', 'e-commerce', 'social',
+    'transportation', 'logistics', 'manufacturing', 'agriculture'
+)
+
+_TITLE_DOMAIN_AUTOMATON = _build_term_automaton(PROJECT_TITLE_DOMAIN_TERMS)
+_TITLE_TECH_AUTOMATON = _build_term_automaton(PROJECT_TITLE_TECH_TERMS)
+_DETAIL_AUTOMATON = _build_term_automaton(PROJECT_DETAIL_KEYWORDS)
+_COMPLEXITY_AUTOMATON = _build_term_automaton(PROJECT_COMPLEXITY_TERMS)
+_ADVANCED_AUTOMATON = _build_term_automaton(PROJECT_ADVANCED_TERMS)
+_PRACTICAL_AUTOMATON = _build_term_automaton(PROJECT_PRACTICAL_TERMS)
+_DOMAIN_APPS_AUTOMATON = _build_term_automaton(PROJECT_DOMAIN_APPS)
+
+# ============================================================================
+# CERTIFICATION & ACHIEVEMENT TABLES
+# ============================================================================
+
+# Certification keyword -> points (first listed keyword found wins)
+CERTIFICATION_WEIGHTS = {'aws':15,'azure':15,'gcp':15,'oracle':12,'sap':12,'cisco':12,'redhat':10,'linux':8,'python':5,'java':5}
+# Achievement keyword -> points (first listed keyword found wins)
+ACHIEVEMENT_WEIGHTS = {'winner':18,'rank':10,'publication':15,'patent':12,'open source':10,'conference':12,'scholarship':15}
+
+def _build_weight_automaton(weights):
+    """Aho-Corasick automaton yielding (priority, weight) for each keyword in a weight map"""
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, weight) in enumerate(weights.items()):
+        automaton.add_word(keyword, (priority, weight))
+    automaton.make_automaton()
+    return automaton
+
+def _first_weight(automaton, text, default):
+    """Weight of the highest-priority keyword found in text, or default"""
+    hits = [value for _, value in automaton.iter(text)]
+    return min(hits)[1] if hits else default
+
+_CERTIFICATION_AUTOMATON = _build_weight_automaton(CERTIFICATION_WEIGHTS)
+_ACHIEVEMENT_AUTOMATON = _build_weight_automaton(ACHIEVEMENT_WEIGHTS)
+
+# ============================================================================
+# RECOMMENDATION TABLES
+# ============================================================================
+
+# Maximum number of recommendations returned per prediction
+MAX_RECOMMENDATIONS = 6
+
+# Skills that mark a Data Science profile (matched as substrings of user skills)
+DATA_SCIENCE_SKILLS = frozenset({
+    'python', 'pandas', 'numpy', 'scikit-learn', 'machine learning', 'sql', 
+    'tableau', 'power bi', 'statistics', 'data analysis', 'tensorflow', 
+    'pytorch', 'r', 'jupyter', 'matplotlib', 'seaborn'
+})
+_DATA_SCIENCE_AUTOMATON = _build_term_automaton(DATA_SCIENCE_SKILLS)
+
+# Domain-specific recommendations: (exact domain IDs, substrings of the lowercased
+# domain, recommendations); the first matching row wins
+DOMAIN_RECOMMENDATIONS = (
+    (('btech_cse',), ('computer',), (
+        "💻 Stay updated with latest technologies like AI/ML, Cloud Computing, and DevOps.",
+    )),
+    (('management',), ('bba',), (
+        "📊 Develop strong analytical and communication skills for business roles.",
+    )),
+    (('pharmacy',), (), (
+        "💊 Focus on clinical research and regulatory compliance knowledge.",
+    )),
+    ((), ('data', 'analytics'), (
+        "📊 Master the data science pipeline: collection, cleaning, analysis, and visualization.",
+        "🔍 Learn both Python and R for comprehensive data analysis capabilities.",
+    )),
+)
+
 # ============================================================================
 
 class MLPlacementPredictor:
@@ -218,6 +559,18 @@ class MLPlacementPredictor:
         self.feature_columns = ['10th_%', '12th_%', 'Aggregate_%']
         self.is_loaded = False
         
+        # Plain numpy copies of the fitted scaler parameters (set by load_model)
+        self._scaler_mean = None
+        self._scaler_scale = None
+        
+        # Scoring function resolved once at load (predict_proba if available, else predict)
+        self._has_proba = False
+        self._score_fn = None
+        
+        # LRU cache of recent predictions keyed by a hash of the student data
+        self._prediction_cache = OrderedDict()
+        self._prediction_cache_lock = threading.Lock()
+        
         # Try to load the model and scaler
         self.load_model()
     
@@ -243,12 +596,27 @@ class MLPlacementPredictor:
             with open(self.scaler_path, 'rb') as f:
                 self.scaler = pickle.load(f)
             
+            # Resolve the scoring function once instead of per request
+            self._has_proba = hasattr(self.model, 'predict_proba')
+            self._score_fn = self.model.predict_proba if self._has_proba else self.model.predict
+            
             # Validate model integrity
             if not self._validate_model_integrity():
                 logger.error("Model validation failed - model may be corrupted")
                 self.is_loaded = False
                 return False
             
+            # Cache scaler parameters so predict can skip sklearn's input validation
+            n_features = len(self.feature_columns)
+            mean = getattr(self.scaler, 'mean_', None)
+            scale = getattr(self.scaler, 'scale_', None)
+            self._scaler_mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+            self._scaler_scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+            
+            # Cached results belong to the previously loaded model
+            with self._prediction_cache_lock:
+                self._prediction_cache.clear()
+            
             self.is_loaded = True
             logger.info("✅ ML model and scaler loaded and validated successfully!")
             logger.info(f"Model type: {type(self.model).__name__}")
@@ -264,30 +632,27 @@ class MLPlacementPredictor:
     def _validate_model_integrity(self):
         """Validate that the model can make predictions correctly"""
         try:
-            # Test with sample academic data
-            test_samples = [
-                {'10th %': 75.0, '12th %': 80.0, 'Aggregate % till now in Graduation/Diploma': 85.0},
-                {'10th %': 60.0, '12th %': 65.0, 'Aggregate % till now in Graduation/Diploma': 70.0},
-                {'10th %': 90.0, '12th %': 92.0, 'Aggregate % till now in Graduation/Diploma': 95.0}
-            ]
-            
-            for sample in test_samples:
-                test_df = pd.DataFrame([sample])
-                test_scaled = self.scaler.transform(test_df)
-                
-                # Check if model has predict_proba method
-                if hasattr(self.model, 'predict_proba'):
-                    prediction = self.model.predict_proba(test_scaled)[0]
-                    # Validate probability is in valid range [0, 1]
-                    if not (0 <= prediction[1] <= 1):
-                        logger.error(f"Invalid prediction probability: {prediction[1]}")
-                        return False
-                else:
-                    # Fallback to predict if no predict_proba
-                    prediction = self.model.predict(test_scaled)[0]
-                    if prediction < 0:
-                        logger.error(f"Invalid prediction value: {prediction}")
-                        return False
+            # Test with sample academic data (10th %, 12th %, Aggregate %), scored in one batch
+            test_samples = np.array([
+                [75.0, 80.0, 85.0],
+                [60.0, 65.0, 70.0],
+                [90.0, 92.0, 95.0]
+            ], dtype=np.float64)
+            test_scaled = self.scaler.transform(test_samples)
+            
+            # Check if model has predict_proba method
+            if self._has_proba:
+                probabilities = self._score_fn(test_scaled)[:, 1]
+                # Validate probabilities are in valid range [0, 1]
+                if not ((probabilities >= 0) & (probabilities <= 1)).all():
+                    logger.error(f"Invalid prediction probabilities: {probabilities}")
+                    return False
+            else:
+                # Fallback to predict if no predict_proba
+                predictions = self._score_fn(test_scaled)
+                if (predictions < 0).any():
+                    logger.error(f"Invalid prediction values: {predictions}")
+                    return False
             
             logger.info("✅ Model integrity validation passed")
             return True
@@ -297,20 +662,13 @@ class MLPlacementPredictor:
             return False
     
     def _get_domain_keywords(self, selected_id):
-        """Get domain/category-specific keywords for targeted skill matching"""
-        try:
-            # Get keywords specific to the selected domain or category
-            domain_keywords = get_keywords_for_selection(selected_id)
-            
-            logger.info(f"Using {len(domain_keywords)} keywords for selection: {selected_id}")
-            
-            # Return domain-specific keywords for more targeted matching
-            return domain_keywords
-            
-        except Exception as e:
-            logger.error(f"Error getting domain keywords for {selected_id}: {str(e)}")
-            # Fallback to advanced keywords
-            return get_advanced_keywords()
+        """Get precomputed lowercase domain/category-specific keywords for targeted skill matching"""
+        # Unknown selections fall back to advanced keywords
+        domain_keywords = DOMAIN_KEYWORD_BUNDLES.get(selected_id, DEFAULT_KEYWORD_BUNDLE)
+        
+        logger.info(f"Using {len(domain_keywords)} keywords for selection: {selected_id}")
+        
+        return domain_keywords
     
     def predict(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -330,6 +688,13 @@ class MLPlacementPredictor:
                 logger.error("ML model not loaded. Cannot make predictions.")
                 return self._fallback_prediction(student_data)
             
+            # Identical profile predicted recently - reuse the result
+            cache_key = self._prediction_cache_key(student_data)
+            cached_result = self._get_cached_prediction(cache_key)
+            if cached_result is not None:
+                logger.info("ML prediction served from cache")
+                return cached_result
+            
             # Extract and validate required features
             tenth_percent = float(student_data.get('tenthPercentage', 0))
             twelfth_percent = float(student_data.get('twelfthPercentage', 0))
@@ -354,29 +719,21 @@ class MLPlacementPredictor:
             # Extract unselected skills (skills to develop)
             unselected_skills = student_data.get('unselectedSkills', [])
             
-            # Create input data matching the training format
+            # Create input vector matching the training format
             # The model expects: ['10th %', '12th %', 'Aggregate % till now in Graduation/Diploma']
-            input_data = {
-                '10th %': tenth_percent,
-                '12th %': twelfth_percent,
-                'Aggregate % till now in Graduation/Diploma': cgpa_percent
-            }
-            
-            # Create DataFrame with the exact column names expected by the model
-            input_df = pd.DataFrame([input_data])
+            input_vector = np.array([[tenth_percent, twelfth_percent, cgpa_percent]], dtype=np.float64)
             
-            # Scale the features using the loaded scaler
-            input_scaled = self.scaler.transform(input_df)
+            # Scale the features with the cached scaler parameters (same as scaler.transform)
+            input_scaled = (input_vector - self._scaler_mean) / self._scaler_scale
             
             # Make prediction using the stacking classifier
-            if hasattr(self.model, 'predict_proba'):
-                # Get probability of positive class (placed)
-                prediction_proba = self.model.predict_proba(input_scaled)[0]
+            scores = self._score_fn(input_scaled)
+            if self._has_proba:
                 # The model predicts probability of placement (0-1), convert to percentage (0-100)
-                predicted_score = prediction_proba[1] * 100
+                predicted_score = scores[0, 1] * 100
             else:
                 # Fallback to direct prediction if no predict_proba method
-                prediction = self.model.predict(input_scaled)[0]
+                prediction = scores[0]
                 predicted_score = prediction * 100 if prediction <= 1 else prediction
             
             # Ensure score is between 0-100
@@ -469,6 +826,8 @@ class MLPlacementPredictor:
                 'scoreBreakdown': category_breakdown
             }
             
+            self._store_cached_prediction(cache_key, result)
+            
             logger.info(f"ML prediction completed. Score: {predicted_score}%")
             return result
             
@@ -477,18 +836,40 @@ class MLPlacementPredictor:
             logger.info("Falling back to rule-based prediction")
             return self._fallback_prediction(student_data)
     
+    def _prediction_cache_key(self, student_data):
+        """Stable hash of the student data, or None if it cannot be serialized"""
+        try:
+            payload = json.dumps(student_data, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    def _get_cached_prediction(self, cache_key):
+        """Return a copy of a cached prediction result, or None on a miss"""
+        if cache_key is None:
+            return None
+        with self._prediction_cache_lock:
+            result = self._prediction_cache.get(cache_key)
+            if result is None:
+                return None
+            self._prediction_cache.move_to_end(cache_key)
+        # Copy so callers can't mutate the cached entry
+        return copy.deepcopy(result)
+    
+    def _store_cached_prediction(self, cache_key, result):
+        """Store a prediction result, evicting the least recently used entry when full"""
+        if cache_key is None:
+            return
+        result = copy.deepcopy(result)
+        with self._prediction_cache_lock:
+            self._prediction_cache[cache_key] = result
+            self._prediction_cache.move_to_end(cache_key)
+            while len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+    
     def _get_confidence_score(self, predicted_score):
         """Calculate confidence score based on predicted score"""
-        try:
-            # Higher confidence for extreme scores, lower for middle scores
-            if predicted_score >= 80 or predicted_score <= 20:
-                return 95.0
-            elif predicted_score >= 60 or predicted_score <= 40:
-                return 85.0
-            else:
-                return 75.0
-        except:
-            return 75.0
+        return _CONFIDENCE_TABLE[int(round(max(0.0, min(100.0, predicted_score)) * 100))]
     
     def _calculate_skill_score(self, domain, form_skills, resume_skills, available_role_skills=None, projects=None, certifications=None):
         """
@@ -530,22 +911,23 @@ class MLPlacementPredictor:
                 logger.info(f"  ✅ GUARANTEED 100% SKILL SCORE")
                 return 100.0, form_skills, []
             
-            # Use domain-specific keywords from domainData.js
-            relevant_keywords = self._get_domain_keywords(domain)
+            # No skills at all (common for new students) - nothing to match
+            if not form_skills and not resume_skills:
+                return 0.0, [], []
             
-            # Fallback to basic skills if no keywords available
-            if not relevant_keywords:
-                relevant_keywords = ['python', 'java', 'sql', 'communication', 'problem solving']
+            # Use domain-specific keywords from domainData.js (already lowercased)
+            relevant_keywords_lower = self._get_domain_keywords(domain)
             
-            # Normalize keywords to lowercase for matching
-            relevant_keywords_lower = [kw.lower().strip() for kw in relevant_keywords]
+            # Fallback to basic skills if no keywords available
+            if not relevant_keywords_lower:
+                relevant_keywords_lower = ('python', 'java', 'sql', 'communication', 'problem solving')
             
             # ================================================================
             # STEP 1: DEDUPLICATE, NORMALIZE AND CATEGORIZE SKILLS
             # ================================================================
             all_skills = []
             seen_skills_canonical = set()  # Track canonical forms
-            skill_sources = []  # Track if skill is from form or resume
+            form_mask = []  # True if skill came from the form, False if from resume
             skill_categories = set()  # Track skill categories for diversity
             
             # Process form skills first (higher priority)
@@ -560,7 +942,7 @@ class MLPlacementPredictor:
                 if canonical not in seen_skills_canonical:
                     all_skills.append(skill_clean)
                     seen_skills_canonical.add(canonical)
-                    skill_sources.append('form')
+                    form_mask.append(True)
                     skill_categories.add(self._get_skill_category(skill_clean))
             
             # Process resume skills (if not already present)
@@ -575,7 +957,7 @@ class MLPlacementPredictor:
                 if canonical not in seen_skills_canonical:
                     all_skills.append(skill_clean)
                     seen_skills_canonical.add(canonical)
-                    skill_sources.append('resume')
+                    form_mask.append(False)
                     skill_categories.add(self._get_skill_category(skill_clean))
             
             # ================================================================
@@ -585,13 +967,31 @@ class MLPlacementPredictor:
             matched_skill_details = []
             form_verified = 0  # Form skills verified by resume/projects
             
-            for i, skill in enumerate(all_skills):
-                skill_lower = skill.lower().strip()
-                is_form_skill = skill_sources[i] == 'form'
-                
-                # Try to find a match using stricter matching (85% threshold)
-                match_result = self._find_skill_match_strict(skill_lower, relevant_keywords_lower)
-                
+            # Exact/synonym/substring matching per skill, then one batched
+            # fuzzy pass (85% threshold) for every skill still unmatched
+            skills_lower = [skill.lower().strip() for skill in all_skills]
+            match_results = [
+                self._find_skill_match_strict(skill_lower, relevant_keywords_lower, use_fuzzy=False)
+                for skill_lower in skills_lower
+            ]
+            unmatched = [i for i, result in enumerate(match_results) if not result['matched']]
+            if unmatched:
+                keyword_index = _prepare_keyword_index(tuple(relevant_keywords_lower))
+                fuzzy_scores = self._batch_fuzzy_scores([skills_lower[i] for i in unmatched], keyword_index.keywords)
+                best_columns = fuzzy_scores.argmax(axis=1)
+                for row, i in enumerate(unmatched):
+                    best_score = float(fuzzy_scores[row, best_columns[row]])
+                    if best_score >= STRICT_FUZZY_MATCH_THRESHOLD:
+                        match_results[i] = {
+                            'matched': True,
+                            'match_type': 'fuzzy',
+                            'matched_keyword': keyword_index.keywords[best_columns[row]],
+                            'confidence': int(best_score * 100)
+                        }
+                    # Fuzzy matching was the last strategy, so this result is final
+                    _store_skill_match(skills_lower[i], keyword_index, match_results[i])
+            
+            for skill, skill_lower, is_form_skill, match_result in zip(all_skills, skills_lower, form_mask, match_results):
                 if match_result['matched']:
                     matching_skills += 1
                     
@@ -606,7 +1006,7 @@ class MLPlacementPredictor:
                     
                     matched_skill_details.append({
                         'skill': skill,
-                        'source': skill_sources[i],
+                        'source': 'form' if is_form_skill else 'resume',
                         'verified': verified,
                         'match_type': match_result['match_type'],
                         'matched_keyword': match_result['matched_keyword'],
@@ -693,21 +1093,7 @@ class MLPlacementPredictor:
         Returns:
             str: Canonical form of the skill
         """
-        skill_lower = skill.lower().strip()
-        
-        # Remove common punctuation and normalize
-        skill_normalized = skill_lower.replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
-        
-        # Check if it's a known synonym
-        if skill_normalized in SYNONYM_TO_CANONICAL:
-            return SYNONYM_TO_CANONICAL[skill_normalized]
-        
-        # Also check original (with spaces)
-        if skill_lower in SYNONYM_TO_CANONICAL:
-            return SYNONYM_TO_CANONICAL[skill_lower]
-        
-        # Return normalized form if not found
-        return skill_normalized
+        return _canonical_skill(skill)
     
     def _get_skill_category(self, skill: str) -> str:
         """Categorize skill into one of 5 main categories"""
@@ -797,7 +1183,7 @@ class MLPlacementPredictor:
         
         return count
     
-    def _find_skill_match_strict(self, skill_lower: str, relevant_keywords_lower: List[str]) -> Dict[str, Any]:
+    def _find_skill_match_strict(self, skill_lower: str, relevant_keywords_lower: List[str], use_fuzzy: bool = True) -> Dict[str, Any]:
         """
         Find a match for a skill using stricter fuzzy logic (85% threshold)
         
@@ -810,69 +1196,74 @@ class MLPlacementPredictor:
         Args:
             skill_lower: Lowercase skill to match
             relevant_keywords_lower: List of lowercase domain keywords
+            use_fuzzy: Run Strategy 4 here (False when the caller batches fuzzy
+                scoring with _batch_fuzzy_scores)
             
         Returns:
             dict: Match result with matched status, type, keyword, and confidence
         """
-        from difflib import SequenceMatcher
+        keyword_index = _prepare_keyword_index(tuple(relevant_keywords_lower))
+        
+        # Repeated (skill, keyword list) pairs are served from the shared match cache
+        result = _cached_skill_match(skill_lower, keyword_index)
+        if result is None:
+            result = self._match_skill_strict(skill_lower, keyword_index, use_fuzzy)
+            # Without Strategy 4 a miss is not final, so only complete results are cached
+            if use_fuzzy or result['matched']:
+                _store_skill_match(skill_lower, keyword_index, result)
+        return result
+    
+    def _match_skill_strict(self, skill_lower: str, keyword_index: _KeywordIndex, use_fuzzy: bool) -> Dict[str, Any]:
+        """Uncached body of _find_skill_match_strict"""
+        skill_normalized = skill_lower.translate(_SKILL_STRIP)
+        skill_canonical = self._get_canonical_skill(skill_lower)
+        
+        # Strategy 1: Exact match (O(1) lookup on normalized form)
+        exact_keyword = keyword_index.exact.get(skill_normalized)
+        if exact_keyword is not None:
+            return {
+                'matched': True,
+                'match_type': 'exact',
+                'matched_keyword': exact_keyword,
+                'confidence': 100
+            }
         
-        skill_normalized = skill_lower.replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
+        # Strategy 2 candidate: O(1) canonical lookup, done before any scanning
+        synonym_position = keyword_index.canonical.get(skill_canonical)
         
-        for keyword in relevant_keywords_lower:
-            keyword_normalized = keyword.replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
-            
-            # Strategy 1: Exact match
-            if skill_lower == keyword or skill_normalized == keyword_normalized:
-                return {
-                    'matched': True,
-                    'match_type': 'exact',
-                    'matched_keyword': keyword,
-                    'confidence': 100
-                }
-            
-            # Strategy 2: Synonym match
-            skill_canonical = self._get_canonical_skill(skill_lower)
-            keyword_canonical = self._get_canonical_skill(keyword)
-            
-            if skill_canonical == keyword_canonical:
-                return {
-                    'matched': True,
-                    'match_type': 'synonym',
-                    'matched_keyword': keyword,
-                    'confidence': 95
-                }
-            
-            # Strategy 3: Substring match - with validation to prevent false positives
-            # Only match if keyword is substantial (>=4 chars) and skill length is reasonable
-            if len(keyword_normalized) >= 4 and keyword_normalized in skill_normalized:
-                if len(skill_normalized) <= len(keyword_normalized) * 1.5:
-                    return {
-                        'matched': True,
-                        'match_type': 'substring',
-                        'matched_keyword': keyword,
-                        'confidence': 90
-                    }
-            
-            if len(skill_normalized) >= 4 and skill_normalized in keyword_normalized:
-                if len(keyword_normalized) <= len(skill_normalized) * 1.5:
-                    return {
-                        'matched': True,
-                        'match_type': 'substring',
-                        'matched_keyword': keyword,
-                        'confidence': 90
-                    }
+        # Strategy 3 candidate: first keyword passing the substring validation,
+        # searched only ahead of the synonym hit (a tie goes to the synonym)
+        # Only match if keyword is substantial (>=4 chars) and skill length is reasonable
+        substring_position = keyword_index.substring_position(skill_normalized, before=synonym_position)
         
-        # Strategy 4: Fuzzy match with STRICTER threshold (85% instead of 80%)
-        best_ratio = 0
-        best_keyword = None
+        # Strategy 2: Synonym match (wins over a substring match on a later keyword)
+        if synonym_position is not None and substring_position is None:
+            return {
+                'matched': True,
+                'match_type': 'synonym',
+                'matched_keyword': keyword_index.entries[synonym_position][0],
+                'confidence': 95
+            }
         
-        for keyword in relevant_keywords_lower:
-            ratio = SequenceMatcher(None, skill_lower, keyword).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_keyword = keyword
+        # Strategy 3: Substring match - with validation to prevent false positives
+        if substring_position is not None:
+            return {
+                'matched': True,
+                'match_type': 'substring',
+                'matched_keyword': keyword_index.entries[substring_position][0],
+                'confidence': 90
+            }
         
-        if best_ratio >= 0.85:  # Stricter threshold
+        # Strategy 4: Fuzzy match with STRICTER threshold (85% instead of 80%)
+        best_match = None
+        if use_fuzzy:
+            best_match = process.extractOne(
+                skill_lower, keyword_index.keywords,
+                scorer=Indel.normalized_similarity, score_cutoff=STRICT_FUZZY_MATCH_THRESHOLD
+            )
+        
+        if best_match is not None:
+            best_keyword, best_ratio, _ = best_match
             return {
                 'matched': True,
                 'match_type': 'fuzzy',
@@ -888,106 +1279,19 @@ class MLPlacementPredictor:
             'confidence': 0
         }
     
-    def _find_skill_match(self, skill_lower: str, relevant_keywords_lower: List[str]) -> Dict[str, Any]:
+    def _batch_fuzzy_scores(self, skills_lower: List[str], relevant_keywords_lower: List[str]) -> np.ndarray:
         """
-        Find a match for a skill using multiple strategies with fuzzy logic
+        Fuzzy-score every skill against every keyword in one call (Strategy 4 of
+        _find_skill_match_strict). Similarities are 0-1; below the strict threshold are 0.
         
-        Matching Strategies (in order of priority):
-        1. Exact match (100% confidence)
-        2. Synonym match (95% confidence)
-        3. Substring match (90% confidence)
-        4. Fuzzy match >= 80% (fuzzy score as confidence)
-        
-        Args:
-            skill_lower: Lowercase skill to match
-            relevant_keywords_lower: List of lowercase domain keywords
-            
         Returns:
-            dict: Match result with matched status, type, keyword, and confidence
+            ndarray of shape (len(skills_lower), len(relevant_keywords_lower))
         """
-        skill_normalized = skill_lower.replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
-        
-        for keyword in relevant_keywords_lower:
-            keyword_normalized = keyword.replace('.', '').replace('-', '').replace('_', '').replace(' ', '')
-            
-            # ============================================================
-            # STRATEGY 1: EXACT MATCH
-            # ============================================================
-            if skill_lower == keyword or skill_normalized == keyword_normalized:
-                return {
-                    'matched': True,
-                    'match_type': 'exact',
-                    'matched_keyword': keyword,
-                    'confidence': 100
-                }
-            
-            # ============================================================
-            # STRATEGY 2: SYNONYM MATCH
-            # ============================================================
-            skill_canonical = self._get_canonical_skill(skill_lower)
-            keyword_canonical = self._get_canonical_skill(keyword)
-            
-            if skill_canonical == keyword_canonical:
-                return {
-                    'matched': True,
-                    'match_type': 'synonym',
-                    'matched_keyword': keyword,
-                    'confidence': 95
-                }
-            
-            # ============================================================
-            # STRATEGY 3: SUBSTRING MATCH
-            # ============================================================
-            # Skill contains keyword
-            if keyword_normalized in skill_normalized and len(keyword_normalized) >= 2:
-                return {
-                    'matched': True,
-                    'match_type': 'substring',
-                    'matched_keyword': keyword,
-                    'confidence': 90
-                }
-            
-            # Keyword contains skill
-            if skill_normalized in keyword_normalized and len(skill_normalized) >= 2:
-                return {
-                    'matched': True,
-                    'match_type': 'substring',
-                    'matched_keyword': keyword,
-                    'confidence': 90
-                }
-        
-        # ============================================================
-        # STRATEGY 4: FUZZY MATCH (using fuzzywuzzy)
-        # ============================================================
-        best_fuzzy_score = 0
-        best_fuzzy_keyword = None
-        
-        for keyword in relevant_keywords_lower:
-            # Use token_sort_ratio for better handling of word order differences
-            fuzzy_score = fuzz.token_sort_ratio(skill_lower, keyword)
-            
-            if fuzzy_score > best_fuzzy_score:
-                best_fuzzy_score = fuzzy_score
-                best_fuzzy_keyword = keyword
-        
-        # Accept fuzzy matches >= threshold
-        if best_fuzzy_score >= FUZZY_MATCH_THRESHOLD:
-            return {
-                'matched': True,
-                'match_type': 'fuzzy',
-                'matched_keyword': best_fuzzy_keyword,
-                'confidence': best_fuzzy_score
-            }
-        
-        # ============================================================
-        # NO MATCH FOUND
-        # ============================================================
-        return {
-            'matched': False,
-            'match_type': 'none',
-            'matched_keyword': None,
-            'confidence': 0
-        }
+        return process.cdist(
+            skills_lower, relevant_keywords_lower,
+            scorer=Indel.normalized_similarity, score_cutoff=STRICT_FUZZY_MATCH_THRESHOLD,
+            dtype=np.float64
+        )
     
     def _calculate_experience_score(self, student_data):
         """
@@ -1064,6 +1368,54 @@ class MLPlacementPredictor:
         except Exception as e:
             logger.error(f"Error calculating experience score: {str(e)}")
             return 3  # Lower default - most students have limited industry experience
+    
+    def _calculate_experience_score_batch(self, students):
+        """
+        Calculate experience scores for many students at once (same rules as _calculate_experience_score).
+        
+        Args:
+            students: Sequence of student data dictionaries
+            
+        Returns:
+            numpy array of experience scores (0-10), one per student
+        """
+        rows = [self._experience_inputs(s) for s in students]
+        invalid = np.array([row is None for row in rows], dtype=bool)
+        rows = [row if row is not None else (False, 0, 0, False, 0, False) for row in rows]
+        if not rows:
+            return np.zeros(0)
+        (internships, industrial, virtual,
+         hackathons, num_hackathons, winner) = (np.array(column) for column in zip(*rows))
+        
+        # Internships: industrial 6 each (max 7) + virtual 1 each, capped at 7
+        industrial_score = np.minimum(industrial * 6, 7)
+        internship_score = np.where(internships, np.minimum(industrial_score + virtual, 7), 0)
+        
+        # Hackathons: 0.5 per participation (max 2) + 3 for a win, capped at 5
+        participation_points = np.minimum(num_hackathons * 0.5, 2)
+        hackathon_score = np.where(hackathons, np.minimum(participation_points + winner * 3, 5), 0)
+        
+        final_scores = np.minimum(internship_score + hackathon_score, 10)
+        return np.where(invalid, 3, final_scores)  # Same default as the single-student path
+    
+    @staticmethod
+    def _experience_inputs(student_data):
+        """Coerce one student's experience fields, or None where the scalar path would fail"""
+        try:
+            internships = bool(student_data.get('internshipsCompleted', False))
+            industrial = virtual = 0
+            if internships:
+                industrial = int(student_data.get('industrialInternships', 0))
+                virtual = int(student_data.get('virtualInternships', 0))
+            
+            hackathons = bool(student_data.get('hackathonsParticipated', False))
+            num_hackathons, winner = 0, False
+            if hackathons:
+                num_hackathons = int(student_data.get('numHackathons', 0))
+                winner = student_data.get('hackathonWinner', '').lower() == 'yes'
+            return internships, industrial, virtual, hackathons, num_hackathons, winner
+        except Exception:
+            return None
 
     def _calculate_project_score(self, projects, selected_id=None):
         """
@@ -1110,11 +1462,11 @@ class MLPlacementPredictor:
                 # Track strong projects (score >= 60 out of 100)
                 if score >= 60:
                     strong_projects.append(project_info['title'])
-                    logger.info(f"✨ Strong project found: '{project_info['title']}' (Score: {score})")
+                    logger.debug("✨ Strong project found: '%s' (Score: %s)", project_info['title'], score)
                 elif score >= 40:
-                    logger.info(f"📝 Good project: '{project_info['title']}' (Score: {score})")
+                    logger.debug("📝 Good project: '%s' (Score: %s)", project_info['title'], score)
                 else:
-                    logger.info(f"📌 Basic project: '{project_info['title']}' (Score: {score})")
+                    logger.debug("📌 Basic project: '%s' (Score: %s)", project_info['title'], score)
             
             # DO NOT SORT - Use user's original order
             # Calculate weighted score based on first 3 projects in user's order
@@ -1138,30 +1490,24 @@ class MLPlacementPredictor:
             else:
                 depth_level = 'minimal'
             
-            # Log detailed scoring summary
-            logger.info("=" * 60)
-            logger.info("PROJECT SCORING SUMMARY (WEIGHTED BY USER ORDER)")
-            logger.info("=" * 60)
-            logger.info(f"Total projects evaluated: {len(all_project_scores)}")
-            logger.info(f"📊 Weighted Scoring Breakdown (User's Order):")
-            logger.info(f"   Project 1 (First): {project1_score}/100 × 40% = {project1_score * 0.40:.2f}")
-            logger.info(f"   Project 2 (Second): {project2_score}/100 × 40% = {project2_score * 0.40:.2f}")
-            logger.info(f"   Project 3 (Third): {project3_score}/100 × 20% = {project3_score * 0.20:.2f}")
-            logger.info(f"   Final Weighted Score: {weighted_score:.2f}/100")
-            logger.info(f"   Depth Level: {depth_level}")
-            logger.info(f"Strong projects (60+): {len(strong_projects)}")
-            
-            # Show all project scores for transparency
-            for idx, proj in enumerate(all_project_scores, 1):
-                weight_label = ""
-                if idx == 1:
-                    weight_label = " (40% weight)"
-                elif idx == 2:
-                    weight_label = " (40% weight)"
-                elif idx == 3:
-                    weight_label = " (20% weight)"
-                logger.info(f"  {idx}. {proj['title']}: {proj['score']}/100 ({proj['quality_tier']}){weight_label}")
-            logger.info("=" * 60)
+            # Log scoring summary (full breakdown only when debug logging is enabled)
+            logger.info("Project score: %.2f/100 (%s, %d strong of %d evaluated)",
+                        weighted_score, depth_level, len(strong_projects), len(all_project_scores))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=" * 60)
+                logger.debug("PROJECT SCORING SUMMARY (WEIGHTED BY USER ORDER)")
+                logger.debug("=" * 60)
+                logger.debug("📊 Weighted Scoring Breakdown (User's Order):")
+                logger.debug("   Project 1 (First): %s/100 × 40%% = %.2f", project1_score, project1_score * 0.40)
+                logger.debug("   Project 2 (Second): %s/100 × 40%% = %.2f", project2_score, project2_score * 0.40)
+                logger.debug("   Project 3 (Third): %s/100 × 20%% = %.2f", project3_score, project3_score * 0.20)
+                
+                # Show all project scores for transparency
+                weight_labels = {1: " (40% weight)", 2: " (40% weight)", 3: " (20% weight)"}
+                for idx, proj in enumerate(all_project_scores, 1):
+                    logger.debug("  %d. %s: %s/100 (%s)%s", idx, proj['title'], proj['score'],
+                                 proj['quality_tier'], weight_labels.get(idx, ""))
+                logger.debug("=" * 60)
             
             # Return weighted score
             return weighted_score, depth_level, strong_projects
@@ -1198,33 +1544,38 @@ class MLPlacementPredictor:
         score = 0
         details = []
         
+        # Lowercase once; every sub-evaluator works on these shared forms
+        title_lower = title.lower()
+        description_lower = description.lower()
+        combined_lower = title_lower + " " + description_lower
+        
         # 1. Base score for having a project (10 points)
         base_score = 10
         score += base_score
         details.append(f"✓ Base score: {base_score}")
         
         # 2. Title quality (0-15 points)
-        title_score = self._evaluate_title(title)
+        title_score = self._evaluate_title(title_lower)
         score += title_score
         details.append(f"✓ Title quality: {title_score}/15")
         
         # 3. Description length and detail (0-20 points) 
-        desc_score = self._evaluate_description(description)
+        desc_score = self._evaluate_description(description_lower)
         score += desc_score
         details.append(f"✓ Description detail: {desc_score}/20")
         
         # 4. Technology stack depth (0-30 points) - INCREASED from 25
-        tech_score = self._evaluate_technology_stack(title + " " + description)
+        tech_score = self._evaluate_technology_stack(combined_lower)
         score += tech_score
         details.append(f"✓ Technology depth: {tech_score}/30")
         
         # 5. Implementation complexity (0-15 points)
-        complexity_score = self._evaluate_complexity(description)
+        complexity_score = self._evaluate_complexity(description_lower)
         score += complexity_score
         details.append(f"✓ Complexity: {complexity_score}/15")
         
         # 6. Real-world applicability (0-10 points)
-        practical_score = self._evaluate_practical_value(title, description)
+        practical_score = self._evaluate_practical_value(combined_lower)
         score += practical_score
         details.append(f"✓ Practical value: {practical_score}/10")
         
@@ -1249,45 +1600,36 @@ class MLPlacementPredictor:
             'quality_tier': quality_tier
         }
     
-    def _evaluate_title(self, title):
-        """Evaluate project title quality (5-15 points)"""
-        if not title:
+    def _evaluate_title(self, title_lower):
+        """Evaluate project title quality (5-15 points); expects a lowercased title"""
+        if not title_lower:
             return 5
         
         score = 5  # Base for having a title
         
         # Bonus for descriptive titles
-        if len(title.split()) >= 3:
+        if len(title_lower.split()) >= 3:
             score += 3
         
         # Bonus for domain-specific terms
-        domain_terms = [
-            'system', 'platform', 'application', 'tool', 'framework',
-            'dashboard', 'portal', 'analyzer', 'predictor', 'classifier',
-            'detector', 'generator', 'optimizer', 'manager', 'tracker'
-        ]
-        if any(term in title.lower() for term in domain_terms):
+        if _has_any_term(_TITLE_DOMAIN_AUTOMATON, title_lower):
             score += 4
         
         # Bonus for technology mentions in title
-        tech_terms = [
-            'web', 'mobile', 'ai', 'ml', 'data', 'cloud', 'iot',
-            'blockchain', 'android', 'react', 'python', 'java'
-        ]
-        if any(term in title.lower() for term in tech_terms):
+        if _has_any_term(_TITLE_TECH_AUTOMATON, title_lower):
             score += 3
         
         return min(score, 15)
     
-    def _evaluate_description(self, description):
-        """Evaluate description quality and detail (5-20 points)"""
-        if not description:
+    def _evaluate_description(self, description_lower):
+        """Evaluate description quality and detail (5-20 points); expects lowercased text"""
+        if not description_lower:
             return 5
         
         score = 5  # Base for having description
         
         # Length-based scoring
-        length = len(description)
+        length = len(description_lower)
         if length > 200:
             score += 8
         elif length > 100:
@@ -1296,19 +1638,15 @@ class MLPlacementPredictor:
             score += 3
         
         # Detail indicators
-        detail_keywords = [
-            'implemented', 'developed', 'built', 'created', 'designed',
-            'integrated', 'deployed', 'optimized', 'features', 'functionality',
-            'database', 'api', 'interface', 'algorithm', 'architecture'
-        ]
-        detail_count = sum(1 for kw in detail_keywords if kw in description.lower())
+        detail_count = _count_terms(_DETAIL_AUTOMATON, description_lower)
         score += min(detail_count * 1, 7)  # Up to 7 points for implementation details
         
         return min(score, 20)
     
-    def _evaluate_technology_stack(self, text):
+    def _evaluate_technology_stack(self, text_lower):
         """
         Evaluate technology stack diversity and depth (0-30 points)
+        Expects lowercased text.
         
         Scoring:
         - Base: 5 points
@@ -1317,41 +1655,19 @@ class MLPlacementPredictor:
         
         Total: 5 + 14 + 11 = 30 points max
         """
-        text_lower = text.lower()
         score = 5  # Base score
         
-        # Technology categories with comprehensive tech lists
-        tech_categories = {
-            'frontend': ['react', 'vue', 'angular', 'html', 'css', 'javascript', 'typescript', 
-                        'jquery', 'bootstrap', 'tailwind', 'sass', 'webpack', 'next.js', 'nuxt'],
-            'backend': ['node.js', 'express', 'django', 'flask', 'spring', 'asp.net', 'php', 
-                       'ruby', 'rails', 'fastapi', 'laravel', 'nest.js', 'koa'],
-            'database': ['mysql', 'postgresql', 'mongodb', 'sqlite', 'redis', 'oracle', 
-                        'nosql', 'cassandra', 'dynamodb', 'mariadb', 'firebase'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'heroku', 'netlify',
-                     'vercel', 'digitalocean', 'cloud', 'serverless', 'lambda'],
-            'mobile': ['android', 'ios', 'react native', 'flutter', 'kotlin', 'swift',
-                      'xamarin', 'ionic', 'cordova', 'mobile'],
-            'ai_ml': ['python', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 
-                     'opencv', 'keras', 'machine learning', 'deep learning', 'nlp', 'cv'],
-            'tools': ['git', 'jenkins', 'ci/cd', 'testing', 'apis', 'rest', 'graphql',
-                     'postman', 'swagger', 'junit', 'jest', 'pytest', 'selenium']
-        }
-        
-        categories_found = 0
+        # One automaton pass finds every technology mentioned in the text
+        seen_techs = set()
+        category_mask = 0
         total_techs = 0
-        found_techs = []
+        for _, (tech, tech_category_mask, tech_category_count) in _TECH_AUTOMATON.iter(text_lower):
+            if tech not in seen_techs:
+                seen_techs.add(tech)
+                category_mask |= tech_category_mask
+                total_techs += tech_category_count
         
-        for category, techs in tech_categories.items():
-            found_in_category = 0
-            for tech in techs:
-                if tech in text_lower:
-                    found_in_category += 1
-                    total_techs += 1
-                    found_techs.append(tech)
-            
-            if found_in_category > 0:
-                categories_found += 1
+        categories_found = category_mask.bit_count()
         
         # Score based on diversity and depth
         category_points = categories_found * 2  # 2 points per category (max 14)
@@ -1360,59 +1676,37 @@ class MLPlacementPredictor:
         score += category_points
         score += tech_points
         
-        logger.debug(f"Tech Stack: {categories_found} categories, {total_techs} technologies = {score}/30")
+        logger.debug("Tech Stack: %d categories, %d technologies = %d/30", categories_found, total_techs, score)
         
         return min(score, 30)
     
-    def _evaluate_complexity(self, description):
-        """Evaluate implementation complexity (0-15 points)"""
-        if not description:
+    def _evaluate_complexity(self, text_lower):
+        """Evaluate implementation complexity (0-15 points); expects lowercased description"""
+        if not text_lower:
             return 0
         
         score = 0
-        text_lower = description.lower()
         
         # Complexity indicators
-        complexity_terms = [
-            'authentication', 'authorization', 'security', 'encryption',
-            'real-time', 'websocket', 'microservice', 'distributed',
-            'scalable', 'performance', 'optimization', 'load balancing',
-            'caching', 'monitoring', 'logging', 'testing', 'deployment',
-            'ci/cd', 'pipeline', 'architecture', 'design pattern'
-        ]
-        
-        complexity_count = sum(1 for term in complexity_terms if term in text_lower)
+        complexity_count = _count_terms(_COMPLEXITY_AUTOMATON, text_lower)
         score += min(complexity_count * 2, 12)  # Up to 12 points for complexity
         
         # Bonus for advanced implementation details
-        advanced_terms = ['algorithm', 'data structure', 'optimization', 'pattern']
-        if any(term in text_lower for term in advanced_terms):
+        if _has_any_term(_ADVANCED_AUTOMATON, text_lower):
             score += 3
         
         return min(score, 15)
     
-    def _evaluate_practical_value(self, title, description):
-        """Evaluate real-world applicability (0-10 points)"""
-        text = (title + " " + description).lower()
+    def _evaluate_practical_value(self, text):
+        """Evaluate real-world applicability (0-10 points); expects lowercased title + description"""
         score = 0
         
         # Real-world application indicators
-        practical_terms = [
-            'business', 'commercial', 'enterprise', 'production',
-            'user', 'customer', 'client', 'industry', 'solution',
-            'problem solving', 'automation', 'efficiency', 'productivity'
-        ]
-        
-        if any(term in text for term in practical_terms):
+        if _has_any_term(_PRACTICAL_AUTOMATON, text):
             score += 5
         
         # Domain-specific applications
-        domain_apps = [
-            'healthcare', 'finance', 'education', 'e-commerce', 'social',
-            'transportation', 'logistics', 'manufacturing', 'agriculture'
-        ]
-        
-        if any(app in text for app in domain_apps):
+        if _has_any_term(_DOMAIN_APPS_AUTOMATON, text):
             score += 5
         
         return min(score, 10)
@@ -1424,18 +1718,9 @@ class MLPlacementPredictor:
             parts = [c.strip() for c in certifications_str.split(',') if c.strip()]
             if not parts:
                 return 0.0
-            weight_map = {'aws':15,'azure':15,'gcp':15,'oracle':12,'sap':12,'cisco':12,'redhat':10,'linux':8,'python':5,'java':5}
             score = 0
             for c in parts:
-                key = c.lower()
-                added = False
-                for k,w in weight_map.items():
-                    if k in key:
-                        score += w
-                        added = True
-                        break
-                if not added:
-                    score += 4
+                score += _first_weight(_CERTIFICATION_AUTOMATON, c.lower(), 4)
             return min(score, 40)
         except Exception as e:
             logger.error(f"Error scoring certifications: {str(e)}")
@@ -1469,45 +1754,70 @@ class MLPlacementPredictor:
             medium_count = int(student_data.get('dsaMedium', 0) or 0)
             hard_count = int(student_data.get('dsaHard', 0) or 0)
             
-            logger.info(f"📊 DSA Problem Counts - Easy: {easy_count}, Medium: {medium_count}, Hard: {hard_count}")
-            
-            # Calculate individual difficulty scores (0-100 scale)
-            # Easy: 150+ = 100%
-            easy_score = min((easy_count / 150.0) * 100, 100)
+            logger.debug("📊 DSA Problem Counts - Easy: %d, Medium: %d, Hard: %d", easy_count, medium_count, hard_count)
             
-            # Medium: 100+ = 100%
-            medium_score = min((medium_count / 100.0) * 100, 100)
-            
-            # Hard: 30+ = 100%
-            hard_score = min((hard_count / 30.0) * 100, 100)
+            easy_scores, medium_scores, hard_scores, final_scores = self._dsa_scores(
+                np.array([easy_count]), np.array([medium_count]), np.array([hard_count])
+            )
+            easy_score = float(easy_scores[0])
+            medium_score = float(medium_scores[0])
+            hard_score = float(hard_scores[0])
+            final_score = float(final_scores[0])
             
-            # Apply bonus rules
-            # Bonus 1: If Medium >= 50, Easy gets full score
             if medium_count >= 50:
-                easy_score = 100.0
-                logger.info("🎯 Bonus Applied: Medium >= 50, Easy score set to 100%")
-            
-            # Bonus 2: If Hard >= 15, both Easy and Medium get full score
+                logger.debug("🎯 Bonus Applied: Medium >= 50, Easy score set to 100%")
             if hard_count >= 15:
-                easy_score = 100.0
-                medium_score = 100.0
-                logger.info("🎯 Bonus Applied: Hard >= 15, Easy and Medium scores set to 100%")
+                logger.debug("🎯 Bonus Applied: Hard >= 15, Easy and Medium scores set to 100%")
             
-            # Calculate weighted final score
-            # Formula: Easy × 0.20 + Medium × 0.35 + Hard × 0.45
-            final_score = (easy_score * 0.20) + (medium_score * 0.35) + (hard_score * 0.45)
-            
-            logger.info(f"📈 DSA Score Breakdown:")
-            logger.info(f"   Easy: {easy_score:.2f}% × 0.20 = {easy_score * 0.20:.2f}")
-            logger.info(f"   Medium: {medium_score:.2f}% × 0.35 = {medium_score * 0.35:.2f}")
-            logger.info(f"   Hard: {hard_score:.2f}% × 0.45 = {hard_score * 0.45:.2f}")
-            logger.info(f"   Final DSA Score: {final_score:.2f}/100")
+            logger.debug("📈 DSA Score Breakdown:")
+            logger.debug("   Easy: %.2f%% × 0.20 = %.2f", easy_score, easy_score * 0.20)
+            logger.debug("   Medium: %.2f%% × 0.35 = %.2f", medium_score, medium_score * 0.35)
+            logger.debug("   Hard: %.2f%% × 0.45 = %.2f", hard_score, hard_score * 0.45)
+            logger.info("Final DSA Score: %.2f/100", final_score)
             
             return final_score
             
         except Exception as e:
             logger.error(f"Error calculating DSA score: {str(e)}")
             return 0.0
+    
+    def _calculate_dsa_score_batch(self, students):
+        """
+        Calculate DSA scores for many students at once (same rules as _calculate_dsa_score).
+        
+        Args:
+            students: Sequence of student data dictionaries
+            
+        Returns:
+            numpy array of DSA scores (0-100), one per student
+        """
+        easy = np.array([int(s.get('dsaEasy', 0) or 0) for s in students], dtype=np.float64)
+        medium = np.array([int(s.get('dsaMedium', 0) or 0) for s in students], dtype=np.float64)
+        hard = np.array([int(s.get('dsaHard', 0) or 0) for s in students], dtype=np.float64)
+        return self._dsa_scores(easy, medium, hard)[3]
+    
+    @staticmethod
+    def _dsa_scores(easy, medium, hard):
+        """
+        Vectorized DSA scoring core.
+        
+        Returns:
+            Tuple of (easy_score, medium_score, hard_score, final_score) arrays
+        """
+        # Calculate individual difficulty scores (0-100 scale)
+        # Easy: 150+ = 100%, Medium: 100+ = 100%, Hard: 30+ = 100%
+        easy_score = np.minimum((easy / 150.0) * 100, 100.0)
+        medium_score = np.minimum((medium / 100.0) * 100, 100.0)
+        hard_score = np.minimum((hard / 30.0) * 100, 100.0)
+        
+        # Bonus 1: If Medium >= 50, Easy gets full score
+        # Bonus 2: If Hard >= 15, both Easy and Medium get full score
+        easy_score = np.where((medium >= 50) | (hard >= 15), 100.0, easy_score)
+        medium_score = np.where(hard >= 15, 100.0, medium_score)
+        
+        # Formula: Easy × 0.20 + Medium × 0.35 + Hard × 0.45
+        final_score = (easy_score * 0.20) + (medium_score * 0.35) + (hard_score * 0.45)
+        return easy_score, medium_score, hard_score, final_score
 
     def _calculate_achievement_score(self, achievements_text: str):
         try:
@@ -1516,17 +1826,8 @@ class MLPlacementPredictor:
             lines = [l.strip() for l in achievements_text.replace('\r','').split('\n') if l.strip()]
             extracted = []
             score = 0
-            keywords = {'winner':18,'rank':10,'publication':15,'patent':12,'open source':10,'conference':12,'scholarship':15}
             for ln in lines:
-                lower = ln.lower()
-                matched = False
-                for k,w in keywords.items():
-                    if k in lower:
-                        score += w
-                        matched = True
-                        break
-                if not matched:
-                    score += 3
+                score += _first_weight(_ACHIEVEMENT_AUTOMATON, ln.lower(), 3)
                 extracted.append(ln)
             return min(score, 100), extracted  # Cap at 100 to match 0-100 scale
         except Exception as e:
@@ -1557,51 +1858,34 @@ class MLPlacementPredictor:
             Where weights sum to 1.0 (100%)
         """
         try:
-            # Normalize all inputs to their valid ranges
-            academic_norm = self._normalize_score(academic_percent, *SCORE_RANGES['academics'])
-            skills_norm = self._normalize_score(skill_score, *SCORE_RANGES['skills'])
-            projects_norm = self._normalize_score(project_score, *SCORE_RANGES['projects'])
-            dsa_norm = self._normalize_score(dsa_score, *SCORE_RANGES['dsa'])
-            exp_norm = self._normalize_score(experience_score, *SCORE_RANGES['experience'])
-            cert_norm = self._normalize_score(certification_score, *SCORE_RANGES['certifications'])
-            achieve_norm = self._normalize_score(achievement_score, *SCORE_RANGES['achievements'])
-            
-            # Merge certifications + achievements into single bucket (average of both)
-            ach_cert_bucket = (cert_norm + achieve_norm) / 2.0
-            
-            # Calculate weighted composite score using SCORING_WEIGHTS
-            composite = (
-                academic_norm * SCORING_WEIGHTS['academics'] +
-                skills_norm * SCORING_WEIGHTS['skills'] +
-                projects_norm * SCORING_WEIGHTS['projects'] +
-                dsa_norm * SCORING_WEIGHTS['dsa'] +
-                (exp_norm * 10) * SCORING_WEIGHTS['experience'] +  # Convert 0-10 to 0-100 scale
-                ach_cert_bucket * SCORING_WEIGHTS['achievements_certifications']
-            )
+            # Raw inputs in BLEND_INPUTS order through the shared numeric core
+            normalized, components, composite = self._blend_core(np.array([
+                academic_percent, skill_score, project_score, dsa_score,
+                experience_score, certification_score, achievement_score
+            ], dtype=np.float64))
+            composite = float(composite)
             
             # Calculate individual weighted contributions for transparency
-            category_breakdown = {
-                'academics': round(academic_norm * SCORING_WEIGHTS['academics'], 2),
-                'skills': round(skills_norm * SCORING_WEIGHTS['skills'], 2),
-                'projects': round(projects_norm * SCORING_WEIGHTS['projects'], 2),
-                'dsa': round(dsa_norm * SCORING_WEIGHTS['dsa'], 2),
-                'experience': round((exp_norm * 10) * SCORING_WEIGHTS['experience'], 2),
-                'achievements_certifications': round(ach_cert_bucket * SCORING_WEIGHTS['achievements_certifications'], 2),
-                'ml_model_informational': round(ml_score, 2)  # Not weighted but included for reference
-            }
+            weighted = [round(value, 2) for value in (components * _BLEND_WEIGHTS).tolist()]
+            category_breakdown = dict(zip(BLEND_COMPONENTS, weighted))
+            category_breakdown['ml_model_informational'] = round(ml_score, 2)  # Not weighted but included for reference
             
             # Log the scoring breakdown for debugging
-            logger.debug(f"Score Breakdown:")
-            logger.debug(f"  Academics: {academic_norm:.1f} * {SCORING_WEIGHTS['academics']} = {category_breakdown['academics']}")
-            logger.debug(f"  Skills: {skills_norm:.1f} * {SCORING_WEIGHTS['skills']} = {category_breakdown['skills']}")
-            logger.debug(f"  Projects: {projects_norm:.1f} * {SCORING_WEIGHTS['projects']} = {category_breakdown['projects']}")
-            logger.debug(f"  DSA: {dsa_norm:.1f} * {SCORING_WEIGHTS['dsa']} = {category_breakdown['dsa']}")
-            logger.debug(f"  Experience: {exp_norm:.1f} * {SCORING_WEIGHTS['experience']} = {category_breakdown['experience']}")
-            logger.debug(f"  Achievements+Certs: {ach_cert_bucket:.1f} * {SCORING_WEIGHTS['achievements_certifications']} = {category_breakdown['achievements_certifications']}")
-            logger.debug(f"  Final Composite: {composite:.2f}")
-            
-            # Ensure final score is within 0-100 range
-            final_score = self._normalize_score(composite, 0, 100)
+            if logger.isEnabledFor(logging.DEBUG):
+                academic_norm, skills_norm, projects_norm, dsa_norm, exp_norm = normalized[:5].tolist()
+                w_academics, w_skills, w_projects, w_dsa, w_experience, w_ach_cert = _BLEND_WEIGHT_TUPLE
+                c_academics, c_skills, c_projects, c_dsa, c_experience, c_ach_cert = weighted
+                logger.debug("Score Breakdown:")
+                logger.debug("  Academics: %.1f * %s = %s", academic_norm, w_academics, c_academics)
+                logger.debug("  Skills: %.1f * %s = %s", skills_norm, w_skills, c_skills)
+                logger.debug("  Projects: %.1f * %s = %s", projects_norm, w_projects, c_projects)
+                logger.debug("  DSA: %.1f * %s = %s", dsa_norm, w_dsa, c_dsa)
+                logger.debug("  Experience: %.1f * %s = %s", exp_norm, w_experience, c_experience)
+                logger.debug("  Achievements+Certs: %.1f * %s = %s", components[5], w_ach_cert, c_ach_cert)
+                logger.debug("  Final Composite: %.2f", composite)
+            
+            # Ensure final score is within 0-100 range (inputs are already clipped floats)
+            final_score = 0.0 if composite < 0.0 else 100.0 if composite > 100.0 else composite
             
             return final_score, category_breakdown
             
@@ -1613,6 +1897,38 @@ class MLPlacementPredictor:
                 'ml_model_informational': ml_score
             }
     
+    def _blend_scores_batch(self, raw_scores):
+        """
+        Blend many students' scores at once (same rules as _blend_scores).
+        
+        Args:
+            raw_scores: Array of shape (N, 7) with raw component scores
+                in BLEND_INPUTS order
+        
+        Returns:
+            numpy array of N composite scores clamped to 0-100
+        """
+        composites = self._blend_core(np.asarray(raw_scores, dtype=np.float64))[2]
+        return np.clip(composites, 0, 100)
+    
+    @staticmethod
+    def _blend_core(raw_scores):
+        """
+        Vectorized blending core for one (7,) or many (N, 7) rows of raw scores.
+        
+        Returns:
+            Tuple of (normalized inputs, BLEND_COMPONENTS vectors, composite scores)
+        """
+        # Normalize all inputs to their valid ranges
+        normalized = np.clip(raw_scores, _BLEND_INPUT_MINS, _BLEND_INPUT_MAXS)
+        
+        # Component vectors in BLEND_COMPONENTS order (experience 0-10 converted to 0-100 scale,
+        # certifications + achievements merged into a single bucket as the average of both)
+        components = normalized @ _BLEND_PROJECTION
+        
+        # Weighted composite score using SCORING_WEIGHTS
+        return normalized, components, components @ _BLEND_WEIGHTS
+    
     def _normalize_score(self, value, min_val, max_val):
         """
         Normalize a score to be within the specified range.
@@ -1624,6 +1940,9 @@ class MLPlacementPredictor:
         
         Returns:
             Normalized score clamped to [min_val, max_val]
+        
+        Only used on the error path of _blend_scores, where the value may not be
+        numeric; the normal path clamps with np.clip instead.
         """
         try:
             normalized = max(min_val, min(max_val, float(value)))
@@ -1637,19 +1956,13 @@ class MLPlacementPredictor:
         recommendations = []
         
         try:
-            # Check if user has data science skills
-            data_science_skills = {
-                'python', 'pandas', 'numpy', 'scikit-learn', 'machine learning', 'sql', 
-                'tableau', 'power bi', 'statistics', 'data analysis', 'tensorflow', 
-                'pytorch', 'r', 'jupyter', 'matplotlib', 'seaborn'
-            }
-            user_skills_lower = [skill.lower() for skill in skills]
-            ds_skill_count = sum(1 for skill in user_skills_lower 
-                               for ds_skill in data_science_skills 
-                               if ds_skill in skill)
+            # Check if user has data science skills (distinct DS skills contained in each user skill)
+            ds_skill_count = sum(_count_terms(_DATA_SCIENCE_AUTOMATON, skill.lower()) for skill in skills)
+            
+            domain_lower = domain.lower()
             
             # Data Science specific recommendations
-            if ds_skill_count >= 3 or 'data' in domain.lower():
+            if ds_skill_count >= 3 or 'data' in domain_lower:
                 if ds_skill_count < 5:
                     recommendations.append("🔬 Complete the Data Science foundation: Learn Python, Pandas, SQL, and basic statistics.")
                     recommendations.append("📊 Build end-to-end data projects with real datasets (not just tutorials).")
@@ -1676,10 +1989,17 @@ class MLPlacementPredictor:
             if features['12th_%'] < 75:
                 recommendations.append("📖 Work on improving your 12th standard performance as it's often considered by recruiters.")
             
+            # Stop once the list is full - later tips would be cut off anyway
+            if len(recommendations) >= MAX_RECOMMENDATIONS:
+                return recommendations[:MAX_RECOMMENDATIONS]
+            
             # Skill recommendations
             if len(skills) < 3:
                 recommendations.append("🛠️ Develop more technical skills relevant to your domain.")
             
+            if len(recommendations) >= MAX_RECOMMENDATIONS:
+                return recommendations
+            
             # Score-based recommendations
             if placement_score < 50:
                 recommendations.append("💼 Focus on building a strong portfolio with projects and internships.")
@@ -1691,19 +2011,17 @@ class MLPlacementPredictor:
                 recommendations.append("✅ You're well-positioned for placement! Focus on interview preparation.")
                 recommendations.append("🎯 Research target companies and prepare company-specific strategies.")
             
+            if len(recommendations) >= MAX_RECOMMENDATIONS:
+                return recommendations[:MAX_RECOMMENDATIONS]
+            
             # Domain-specific recommendations
-            if domain == 'btech_cse' or 'computer' in domain.lower():
-                recommendations.append("💻 Stay updated with latest technologies like AI/ML, Cloud Computing, and DevOps.")
-            elif domain == 'management' or 'bba' in domain.lower():
-                recommendations.append("📊 Develop strong analytical and communication skills for business roles.")
-            elif domain == 'pharmacy':
-                recommendations.append("💊 Focus on clinical research and regulatory compliance knowledge.")
-            elif 'data' in domain.lower() or 'analytics' in domain.lower():
-                recommendations.append("📊 Master the data science pipeline: collection, cleaning, analysis, and visualization.")
-                recommendations.append("🔍 Learn both Python and R for comprehensive data analysis capabilities.")
-            
-            # Limit to 6 recommendations
-            return recommendations[:6]
+            for domain_ids, domain_tokens, domain_recommendations in DOMAIN_RECOMMENDATIONS:
+                if domain in domain_ids or any(token in domain_lower for token in domain_tokens):
+                    recommendations.extend(domain_recommendations)
+                    break
+            
+            # Limit to MAX_RECOMMENDATIONS recommendations
+            return recommendations[:MAX_RECOMMENDATIONS]
             
         except Exception as e:
             logger.error(f"Error generating recommendations: {str(e)}")
@@ -1746,28 +2064,18 @@ class MLPlacementPredictor:
             # Achievements & certifications (text heuristics)
             certs = student_data.get('certifications', '') or ''
             achievements_text = student_data.get('achievements', '') or ''
-            cert_units = len([c for c in certs.split(',') if c.strip()])
-            ach_lines = len([l for l in achievements_text.split('\n') if l.strip()])
+            cert_units = sum(1 for c in certs.split(',') if c.strip())
+            ach_lines = sum(1 for l in achievements_text.split('\n') if l.strip())
             ach_cert_score = min(cert_units * 10 + ach_lines * 8, 100)
 
-            # Weight blending (30,20,20,15,15)
-            placement_score = (
-                academic_percent * 0.30 +
-                skill_score * 0.20 +
-                project_score * 0.20 +
-                exp_score * 0.15 +
-                ach_cert_score * 0.15
-            )
-            placement_score = max(0, min(100, round(placement_score, 2)))
-
-            breakdown = {
-                'academics': round(academic_percent * 0.30, 2),
-                'skills': round(skill_score * 0.20, 2),
-                'projects': round(project_score * 0.20, 2),
-                'experience': round(exp_score * 0.15, 2),
-                'achievements_certifications': round(ach_cert_score * 0.15, 2),
-                'ml_model_informational': 0
-            }
+            # Weight blending (30,20,20,15,15) - contributions in FALLBACK_COMPONENTS order
+            contributions = np.array([
+                academic_percent, skill_score, project_score, exp_score, ach_cert_score
+            ], dtype=np.float64) * _FALLBACK_WEIGHTS
+            placement_score = max(0.0, min(100.0, round(float(contributions.sum()), 2)))
+
+            breakdown = dict(zip(FALLBACK_COMPONENTS, (round(value, 2) for value in contributions.tolist())))
+            breakdown['ml_model_informational'] = 0
             
             return {
                 'placementScore': int(placement_score),
@@ -1,8 +1,76 @@
 import numpy as np
 from typing import Dict, List, Any
 import json
+import functools
+import random
+import threading
+
+# Number of noise samples drawn per refill of the prediction noise buffer
+NOISE_BUFFER_SIZE = 1024
+
+# Tips shown for each personalization level (3 are sampled per prediction)
+PERSONALIZED_TIPS = {
+    'low': [
+        "Consider taking online courses to strengthen your technical skills",
+        "Work on practice projects to build your portfolio",
+        "Improve your communication and presentation skills",
+        "Join relevant student clubs or professional organizations",
+        "Prepare for technical interviews with practice sessions"
+    ],
+    'medium': [
+        "Focus on a specific domain within your field to become a specialist",
+        "Connect with alumni for mentorship and advice",
+        "Participate in hackathons or competitions to showcase your skills",
+        "Apply for internships to gain practical experience",
+        "Develop your soft skills alongside technical abilities"
+    ],
+    'high': [
+        "Attend industry conferences and networking events",
+        "Look for leadership opportunities in group projects",
+        "Consider pursuing relevant certifications",
+        "Create a strong LinkedIn profile and professional brand",
+        "Research target companies and prepare company-specific strategies"
+    ]
+}
+
+# Domain-related keywords looked for in project titles
+DOMAIN_PROJECT_KEYWORDS = {
+    'Computer Science': ('web', 'app', 'mobile', 'ai', 'ml', 'data', 'software', 'system'),
+    'Mechanical': ('design', 'cad', 'solidworks', 'automotive', 'manufacturing'),
+    'Electrical': ('circuit', 'embedded', 'iot', 'microcontroller', 'pcb'),
+    'Management': ('business', 'marketing', 'finance', 'analysis', 'strategy'),
+    'Pharmacy': ('clinical', 'research', 'drug', 'pharmaceutical', 'medical'),
+    'Agriculture': ('crop', 'soil', 'farming', 'agricultural', 'irrigation')
+}
+
+# Skills scored against when the domain is unknown, as (skill, lowercase skill) pairs
+GENERIC_SKILLS = ('Python', 'Java', 'SQL', 'Communication', 'Problem Solving')
+_GENERIC_SKILL_PAIRS = tuple((skill, skill.lower()) for skill in GENERIC_SKILLS)
+
+
+@functools.lru_cache(maxsize=1024)
+def _diff_skills(domain_skills: tuple, user_skills_lower: frozenset) -> tuple:
+    """
+    Domain skills not covered by the user's skills, in domain order.
+    
+    domain_skills holds (skill, lowercase skill) pairs. A domain skill is
+    covered when it equals, contains or is contained in one of the
+    (lowercase) user skills.
+    """
+    missing = []
+    for skill, skill_lower in domain_skills:
+        # Exact hits via the set, substring scan only for the rest
+        if skill_lower in user_skills_lower:
+            continue
+        if not any(skill_lower in user_skill or user_skill in skill_lower for user_skill in user_skills_lower):
+            missing.append(skill)
+    return tuple(missing)
+
 
 class PlacementPredictor:
+    __slots__ = ('domain_skills', 'related_jobs', '_domain_skill_pairs',
+                 '_rng', '_noise_buf', '_noise_i', '_noise_lock')
+    
     def __init__(self):
         """Initialize the placement predictor with domain data"""
         self.domain_skills = {
@@ -50,6 +118,18 @@ class PlacementPredictor:
                 'Agricultural Officer', 'Agronomist', 'Quality Assurance Officer', 'Farm Manager'
             ]
         }
+        
+        # Lowercased once here instead of on every prediction
+        self._domain_skill_pairs = {
+            domain: tuple((skill, skill.lower()) for skill in skills)
+            for domain, skills in self.domain_skills.items()
+        }
+        
+        # Prediction noise is drawn in batches from a dedicated generator
+        self._rng = np.random.default_rng()
+        self._noise_buf = self._rng.normal(0, 3, size=NOISE_BUFFER_SIZE)
+        self._noise_i = 0
+        self._noise_lock = threading.Lock()
 
     def predict(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -71,24 +151,19 @@ class PlacementPredictor:
             academic_score = cgpa * 8  # CGPA is out of 10, convert to percentage scale
             
             # Calculate skills score (50% weight)
-            domain_skills_list = self.domain_skills.get(domain, [])
-            if not domain_skills_list:
+            domain_skill_pairs = self._domain_skill_pairs.get(domain)
+            if not domain_skill_pairs:
                 # Fallback to generic skills if domain not found
-                domain_skills_list = ['Python', 'Java', 'SQL', 'Communication', 'Problem Solving']
+                domain_skill_pairs = _GENERIC_SKILL_PAIRS
             
-            # Calculate skill match
-            user_skills_lower = [skill.lower() for skill in skills]
-            domain_skills_lower = [skill.lower() for skill in domain_skills_list]
+            # Calculate skill match (uncovered domain skills double as the recommendations)
+            user_skills_lower = frozenset(skill.lower() for skill in skills)
+            missing_skills = _diff_skills(domain_skill_pairs, user_skills_lower)
             
             # Count matching skills
-            matching_skills = 0
-            for domain_skill in domain_skills_lower:
-                for user_skill in user_skills_lower:
-                    if domain_skill in user_skill or user_skill in domain_skill:
-                        matching_skills += 1
-                        break
-            
-            skill_match_percentage = min((matching_skills / len(domain_skills_list)) * 100, 100)
+            matching_skills = len(domain_skill_pairs) - len(missing_skills)
+            
+            skill_match_percentage = min((matching_skills / len(domain_skill_pairs)) * 100, 100)
             skills_score = skill_match_percentage * 0.5
             
             # Calculate experience bonus (10% weight)
@@ -105,16 +180,7 @@ class PlacementPredictor:
             # If project titles are provided, add bonus points for relevant projects
             if project_titles:
                 # Simple relevance check - if project titles contain domain-related keywords
-                domain_keywords = {
-                    'Computer Science': ['web', 'app', 'mobile', 'ai', 'ml', 'data', 'software', 'system'],
-                    'Mechanical': ['design', 'cad', 'solidworks', 'automotive', 'manufacturing'],
-                    'Electrical': ['circuit', 'embedded', 'iot', 'microcontroller', 'pcb'],
-                    'Management': ['business', 'marketing', 'finance', 'analysis', 'strategy'],
-                    'Pharmacy': ['clinical', 'research', 'drug', 'pharmaceutical', 'medical'],
-                    'Agriculture': ['crop', 'soil', 'farming', 'agricultural', 'irrigation']
-                }
-                
-                relevant_keywords = domain_keywords.get(domain, [])
+                relevant_keywords = DOMAIN_PROJECT_KEYWORDS.get(domain, ())
                 project_titles_lower = project_titles.lower()
                 relevant_projects = sum(1 for keyword in relevant_keywords if keyword in project_titles_lower)
                 if relevant_projects > 0:
@@ -144,7 +210,7 @@ class PlacementPredictor:
             final_score = (academic_score * 0.4) + skills_score + experience_bonus
             
             # Add slight randomness for realistic predictions
-            final_score += np.random.normal(0, 3)
+            final_score += self._next_noise()
             final_score = max(0, min(100, final_score))
             
             # Determine placement probability
@@ -159,12 +225,7 @@ class PlacementPredictor:
                 personalization_level = 'high'
             
             # Get recommended skills
-            recommended_skills = []
-            for skill in domain_skills_list:
-                skill_lower = skill.lower()
-                if not any(skill_lower in user_skill or user_skill in skill_lower 
-                          for user_skill in user_skills_lower):
-                    recommended_skills.append(skill)
+            recommended_skills = list(missing_skills)
             
             # Get related jobs
             related_jobs = self.related_jobs.get(domain, [])
@@ -187,35 +248,20 @@ class PlacementPredictor:
         except Exception as e:
             raise Exception(f"Error in prediction: {str(e)}")
 
+    def _next_noise(self) -> float:
+        """Next N(0, 3) sample from the buffer, refilling it when exhausted"""
+        with self._noise_lock:
+            if self._noise_i >= NOISE_BUFFER_SIZE:
+                self._noise_buf = self._rng.normal(0, 3, size=NOISE_BUFFER_SIZE)
+                self._noise_i = 0
+            noise = self._noise_buf[self._noise_i]
+            self._noise_i += 1
+        return float(noise)
+
     def _get_personalized_tips(self, level: str) -> List[str]:
         """Get personalized tips based on placement probability level"""
-        tips = {
-            'low': [
-                "Consider taking online courses to strengthen your technical skills",
-                "Work on practice projects to build your portfolio",
-                "Improve your communication and presentation skills",
-                "Join relevant student clubs or professional organizations",
-                "Prepare for technical interviews with practice sessions"
-            ],
-            'medium': [
-                "Focus on a specific domain within your field to become a specialist",
-                "Connect with alumni for mentorship and advice",
-                "Participate in hackathons or competitions to showcase your skills",
-                "Apply for internships to gain practical experience",
-                "Develop your soft skills alongside technical abilities"
-            ],
-            'high': [
-                "Attend industry conferences and networking events",
-                "Look for leadership opportunities in group projects",
-                "Consider pursuing relevant certifications",
-                "Create a strong LinkedIn profile and professional brand",
-                "Research target companies and prepare company-specific strategies"
-            ]
-        }
-        
         # Return 3 random tips from the appropriate level
-        import random
-        level_tips = tips.get(level, tips['medium'])
+        level_tips = PERSONALIZED_TIPS.get(level, PERSONALIZED_TIPS['medium'])
         return random.sample(level_tips, min(3, len(level_tips)))
 
     def get_domain_skills(self, domain: str) -> List[str]:
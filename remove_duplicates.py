@@ -1,17 +1,50 @@
 """Remove duplicate route definitions after app.run()"""
-with open(r'b:\placement-AI-1\backend\app.py', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Keep only lines up to and including app.run()
-# app.run() is at line 9435 (index 9434)
-# We want to keep up to line 9436 (index 9435) to include the newline after app.run
-lines_to_keep = lines[:9436]
-
-# Write back
-with open(r'b:\placement-AI-1\backend\app.py', 'w', encoding='utf-8') as f:
-    f.writelines(lines_to_keep)
-
-print(f"✅ Removed duplicate routes")
-print(f"   Original lines: {len(lines)}")
-print(f"   New lines: {len(lines_to_keep)}")
-print(f"   Deleted: {len(lines) - len(lines_to_keep)} lines")
+import mmap
+import re
+
+APP_PATH = r'b:\placement-AI-1\backend\app.py'
+
+# Keep only lines up to and including the first app.run() call (and its newline),
+# wherever it ends up in app.py
+APP_RUN_LINE = re.compile(rb'^[ \t]*app\.run\(.*$\n?', re.MULTILINE)
+
+with open(APP_PATH, 'rb+') as f:
+    f.seek(0, 2)
+    size = f.tell()
+
+    newlines = 0
+    keep_offset = None
+    kept_lines = None
+    last_byte = b''
+    if size:
+        # Memory-map the file, locate the app.run() line with one regex pass, then
+        # hop between newlines with mmap.find (C memchr) to count lines for the report
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = APP_RUN_LINE.search(mm)
+            if match:
+                keep_offset = match.end()
+            pos = mm.find(b'\n')
+            while pos != -1:
+                newlines += 1
+                if pos + 1 == keep_offset:
+                    kept_lines = newlines
+                pos = mm.find(b'\n', pos + 1)
+            last_byte = mm[size - 1:size]
+
+    # A final line without a trailing newline still counts as a line
+    original_lines = newlines + (1 if last_byte and last_byte != b'\n' else 0)
+
+    # Shorten the file in place (no rewrite of the kept part), only after the mapping
+    # is closed (required on Windows) and only when something follows app.run()
+    if keep_offset is not None and keep_offset < size:
+        f.truncate(keep_offset)
+
+new_lines = kept_lines if kept_lines is not None else original_lines
+
+if keep_offset is None:
+    print(f"⚠️ No app.run() call found, left {APP_PATH} unchanged")
+else:
+    print(f"✅ Removed duplicate routes")
+print(f"   Original lines: {original_lines}")
+print(f"   New lines: {new_lines}")
+print(f"   Deleted: {original_lines - new_lines} lines")
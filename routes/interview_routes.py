@@ -6,22 +6,164 @@ Provides AI interview functionality with smart features:
 - Conditional compliments (only for good answers)
 - Position-specific questions
 """
-from flask import Blueprint, request, jsonify, session
-from datetime import datetime
+from flask import Blueprint, Response, request, jsonify, session, after_this_request
+from datetime import datetime, timezone
 import os
+import copy
 import json
 import re
 import random
 from langdetect import detect, LangDetectException
+from langdetect.detector_factory import init_factory
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import ahocorasick
+import hashlib
+import threading
+import time
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.db import get_db
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+try:
+    import orjson  # optional; faster encoding for the large history/feedback documents
+except Exception:
+    orjson = None
 
 interview_bp = Blueprint('interview', __name__, url_prefix='/api/interview')
 
 # Groq API configuration (ULTRA FAST ~200-500ms)
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+# Perplexity API configuration (post-interview feedback analysis)
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+# Feedback analysis models: short or terse interviews go to FEEDBACK_MODEL, longer
+# technical ones to FEEDBACK_MODEL_DETAILED (e.g. sonar-pro); both default to sonar
+FEEDBACK_MODEL = os.getenv('FEEDBACK_MODEL', 'sonar')
+FEEDBACK_MODEL_DETAILED = os.getenv('FEEDBACK_MODEL_DETAILED', FEEDBACK_MODEL)
+
+def get_perplexity_key():
+    """Get Perplexity API key from environment"""
+    key = os.getenv('PERPLEXITY_API_KEY')
+    if not key:
+        print("⚠️ PERPLEXITY_API_KEY not found, using rule-based interview feedback")
+    return key
+
+# JSON schema the feedback analysis must follow (sent as a structured-output
+# response_format, so the reply parses directly with json.loads)
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+FEEDBACK_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "object",
+            "properties": {
+                name: {"type": "number"} for name in (
+                    "technical_knowledge", "communication", "problem_solving",
+                    "professionalism", "enthusiasm", "confidence"
+                )
+            },
+            "required": ["technical_knowledge", "communication", "problem_solving",
+                         "professionalism", "enthusiasm", "confidence"]
+        },
+        "strengths": _STRING_LIST,
+        "improvements": _STRING_LIST,
+        "knowledge_assessment": {
+            "type": "object",
+            "properties": {
+                "demonstrated_skills": _STRING_LIST,
+                "skill_gaps": _STRING_LIST,
+                "depth_of_knowledge": {"type": "string", "enum": ["shallow", "moderate", "deep"]}
+            }
+        },
+        "communication_feedback": {
+            "type": "object",
+            "properties": {
+                "clarity": {"type": "string"},
+                "structure": {"type": "string"},
+                "vocabulary": {"type": "string"}
+            }
+        },
+        "interviewer_guidance": {
+            "type": "object",
+            "properties": {
+                "hiring_recommendation": {"type": "string", "enum": ["Strong Hire", "Hire", "Maybe", "No Hire"]},
+                "reasoning": {"type": "string"},
+                "follow_up_areas": _STRING_LIST
+            }
+        },
+        "detailed_feedback": {"type": "string"}
+    },
+    "required": ["scores", "strengths", "improvements", "detailed_feedback"]
+}
+
+# Connect timeout for outbound AI calls; read timeouts are set per call
+AI_CONNECT_TIMEOUT = 5
+
+# Shared HTTP session so AI calls reuse pooled keep-alive connections instead of
+# paying a fresh TCP + TLS handshake on every request. Content-Type is left to
+# each call (json= vs multipart uploads for transcription). Only failed connection
+# attempts are retried: every AI call is a POST, and a completion that reached the
+# server is not resent
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+class _TTLCache:
+    """Small thread-safe LRU mapping whose entries also expire after ttl_seconds"""
+    
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value if present and not expired, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries past the size limit"""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Exact-match cache of interviewer replies. Many turns send an identical payload
+# (same position, state and instruction; a stock answer like "I'm good, thanks" to
+# the greeting), so those are answered without a Groq round trip. Matching is exact
+# on everything but the latest answer's case/spacing/trailing punctuation, so a reply
+# is never reused for a different conversation
+_reply_cache = _TTLCache(max_entries=512, ttl_seconds=7 * 24 * 3600)
+
+
+def _reply_cache_key(messages):
+    """Hash a chat payload, normalizing only the latest user message"""
+    *context, latest = messages
+    normalized = " ".join(latest["content"].lower().split()).strip(" .!?")
+    payload = json.dumps([context, latest["role"], normalized], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def get_groq_key():
     """Get Groq API key from environment"""
     key = os.getenv('GROQ_API_KEY')
@@ -36,8 +178,153 @@ if _startup_key:
 else:
     print("❌ WARNING: GROQ_API_KEY not set! Get free key at console.groq.com")
 
-# In-memory session storage
-active_sessions = {}
+# langdetect loads its ~55 language profiles on the first detect() call (~300ms);
+# do it at import, i.e. once per gunicorn worker, instead of on a candidate's answer
+if os.getenv('INTERVIEW_EAGER_INIT', '1') == '1':
+    init_factory()
+
+# Interview sessions live in MongoDB (interview_sessions) rather than in process
+# memory, so any gunicorn worker - or a restarted one - can serve any session.
+# Each request loads the session, and /respond writes it back once it has changed
+SESSION_TTL_SECONDS = 6 * 3600
+_session_ttl_index_ready = False
+_database = None
+
+
+def _db():
+    """
+    Database handle shared by this module. get_db() pings the server on every call;
+    the MongoClient behind it pools connections and reconnects by itself, so one
+    handle is resolved on first use and reused afterwards
+    """
+    global _database
+    if _database is None:
+        _database = get_db()
+    return _database
+
+
+def _sessions_collection():
+    """interview_sessions collection, with its expiry index created once per process"""
+    global _session_ttl_index_ready
+    collection = _db().interview_sessions
+    if not _session_ttl_index_ready:
+        # Abandoned interviews (never sent to /end) are removed by MongoDB itself
+        collection.create_index("updated_at", expireAfterSeconds=SESSION_TTL_SECONDS)
+        _session_ttl_index_ready = True
+    return collection
+
+
+def create_session(interview_session):
+    """Store a newly started session"""
+    _sessions_collection().insert_one({
+        "_id": interview_session.session_id,
+        **interview_session.to_state(),
+        "updated_at": datetime.now(timezone.utc)
+    })
+
+
+def save_session(interview_session):
+    """
+    Write an existing session's current state to MongoDB. A no-op once /end has
+    claimed the session (or it has expired) - nothing is upserted in its place
+    """
+    _sessions_collection().replace_one(
+        {"_id": interview_session.session_id, "ending": {"$exists": False}},
+        {**interview_session.to_state(), "updated_at": datetime.now(timezone.utc)}
+    )
+
+
+def load_session(session_id):
+    """Return the stored session, or None if it does not exist, has expired or has ended"""
+    if not session_id:
+        return None
+    doc = _sessions_collection().find_one({"_id": session_id, "ending": {"$exists": False}})
+    return InterviewSession.from_state(doc) if doc else None
+
+
+def claim_session_end(session_id, interview_id):
+    """
+    Atomically mark a session as ending with the interview id it will be stored under.
+    Returns the session if this call won the claim, otherwise None - the session is
+    missing or an earlier /end (see the session's "ending" field) already claimed it
+    """
+    if not session_id:
+        return None
+    doc = _sessions_collection().find_one_and_update(
+        {"_id": session_id, "ending": {"$exists": False}},
+        {"$set": {"ending": interview_id, "updated_at": datetime.now(timezone.utc)}}
+    )
+    return InterviewSession.from_state(doc) if doc else None
+
+
+def release_session_end(session_id):
+    """Undo claim_session_end after a failure so /end can be retried"""
+    _sessions_collection().update_one({"_id": session_id}, {"$unset": {"ending": ""}})
+
+
+_interviews_index_ready = False
+
+
+def _interviews_collection():
+    """interviews collection, with the /history index created once per process"""
+    global _interviews_index_ready
+    collection = _db().interviews
+    if not _interviews_index_ready:
+        # Lets /history walk the user's newest interviews in index order instead
+        # of scanning and sorting the whole collection
+        collection.create_index([("phone_number", 1), ("started_at", -1)])
+        _interviews_index_ready = True
+    return collection
+
+
+# Background writer for completed interviews (see end_interview)
+_write_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="interview-writer")
+
+
+INTERVIEW_WRITE_ATTEMPTS = 3
+
+
+def _insert_interview(interview_data):
+    """Insert an interview record under its pre-generated id; True once it is stored"""
+    try:
+        _interviews_collection().insert_one(interview_data)
+        return True
+    except DuplicateKeyError:
+        # An earlier attempt already stored it
+        return True
+    except Exception as e:
+        print(f"❌ Error saving interview {interview_data.get('_id')}: {e}")
+        return False
+
+
+def _store_completed_interview(interview_data, session_id):
+    """
+    Insert the finished interview record (the ended session expires via its TTL).
+    The client already holds the record's id, so on repeated failure the session
+    keeps its claim and parks the record as pending_interview, for a repeated /end
+    or /feedback/<id> to store under that same id (see _restore_pending_interview)
+    """
+    for attempt in range(INTERVIEW_WRITE_ATTEMPTS):
+        if attempt:
+            time.sleep(0.5 * attempt)
+        if _insert_interview(interview_data):
+            return
+    
+    try:
+        _sessions_collection().update_one(
+            {"_id": session_id},
+            {"$set": {"pending_interview": interview_data, "updated_at": datetime.now(timezone.utc)}}
+        )
+    except Exception as e:
+        print(f"❌ Could not keep interview {interview_data.get('_id')} for a later retry: {e}")
+
+
+def _restore_pending_interview(session_doc):
+    """Store the interview record parked on an ended session and return it"""
+    interview = session_doc["pending_interview"]
+    if _insert_interview(interview):
+        _sessions_collection().update_one({"_id": session_doc["_id"]}, {"$unset": {"pending_interview": ""}})
+    return interview
 
 class InterviewSession:
     """Enhanced interview session with smart features from Groq engine"""
@@ -49,7 +336,7 @@ class InterviewSession:
         self.state = "greeting"
         self.question_count = 0
         self.conversation_history = []
-        self.started_at = datetime.utcnow()
+        self.started_at = datetime.now(timezone.utc)
         self.questions_asked = []  # Track to avoid duplicates
         self.asked_topics = []  # Track question topics
         self.answers = []
@@ -74,6 +361,28 @@ class InterviewSession:
             "correct_answers": self.correct_answers
         }
     
+    def to_state(self):
+        """Everything needed to rebuild the live session (see from_state)"""
+        return {
+            **self.to_dict(),
+            "started_at": self.started_at,
+            "asked_topics": self.asked_topics,
+            "total_questions": self.total_questions
+        }
+    
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a session from a to_state() document"""
+        interview_session = cls(state["session_id"], state["user_name"], state["phone_number"], state["position"])
+        for field in ("state", "question_count", "conversation_history", "started_at", "questions_asked",
+                      "asked_topics", "answers", "difficulty_level", "correct_answers", "total_questions"):
+            if field in state:
+                setattr(interview_session, field, state[field])
+        # MongoDB hands datetimes back naive (but in UTC)
+        if interview_session.started_at.tzinfo is None:
+            interview_session.started_at = interview_session.started_at.replace(tzinfo=timezone.utc)
+        return interview_session
+    
     def get_question_pool(self):
         """Get questions organized by difficulty level"""
         return {
@@ -226,14 +535,21 @@ class InterviewSession:
 
 def get_smart_system_prompt(session):
     """Generate intelligent system prompt like Groq engine"""
-    difficulty_desc = {1: "basic/entry-level", 2: "intermediate", 3: "advanced/senior-level"}.get(session.difficulty_level, "intermediate")
     already_asked = ", ".join(session.asked_topics[-5:]) if session.asked_topics else "none yet"
+    return _build_smart_system_prompt(session.position, session.difficulty_level,
+                                      session.question_count + 1, session.total_questions, already_asked)
+
+
+@lru_cache(maxsize=256)
+def _build_smart_system_prompt(position, difficulty_level, question_number, total_questions, already_asked):
+    """The system prompt text; memoized since sessions at the same point share it"""
+    difficulty_desc = {1: "basic/entry-level", 2: "intermediate", 3: "advanced/senior-level"}.get(difficulty_level, "intermediate")
     
-    return f"""You are Alex, a professional AI interviewer for the {session.position} position.
+    return f"""You are Alex, a professional AI interviewer for the {position} position.
 
 CURRENT STATE:
-- Difficulty Level: {session.difficulty_level}/3 ({difficulty_desc})
-- Question #{session.question_count + 1} of {session.total_questions}
+- Difficulty Level: {difficulty_level}/3 ({difficulty_desc})
+- Question #{question_number} of {total_questions}
 - Already asked about: {already_asked}
 
 STRICT RULES:
@@ -245,7 +561,7 @@ STRICT RULES:
 2. NEVER repeat a question you already asked (check the "Already asked about" list)
 3. Ask {difficulty_desc} questions appropriate for the current level
 4. Keep total response under 35 words
-5. Ask questions specifically relevant to {session.position}
+5. Ask questions specifically relevant to {position}
 6. Never cut off mid-sentence
 7. ALWAYS respond in English only. Never use Hindi or any other language.
 
@@ -335,11 +651,11 @@ def start_interview():
         position = data.get('position', 'Software Developer')
         
         # Generate session ID
-        session_id = f"interview_{datetime.now().timestamp()}"
+        session_id = f"interview_{uuid.uuid4().hex}"
         
         # Create new interview session
         interview_session = InterviewSession(session_id, user_name, phone_number, position)
-        active_sessions[session_id] = interview_session
+        create_session(interview_session)
         
         # Generate greeting
         greeting = f"Hello {user_name}! I'm Alex, your AI interviewer. I'll be conducting a mock interview for the {position} position. How are you doing today?"
@@ -359,6 +675,126 @@ def start_interview():
             "error": str(e)
         }), 500
 
+def _turn_payload(interview_session, message):
+    """JSON body returned for one interviewer turn"""
+    return {
+        "success": True,
+        "message": message,
+        "state": interview_session.state,
+        "question_count": interview_session.question_count,
+        "difficulty_level": interview_session.difficulty_level,
+        "should_speak": True
+    }
+
+
+def _direct_reply(interview_session, user_message, answer_analysis):
+    """
+    Canned reply for abusive, non-English or clarification-request answers, recorded
+    in the conversation history. Returns None when the answer should go to Groq
+    """
+    if answer_analysis.get('is_abusive', False):
+        last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "Tell me about yourself."
+        reply = "Please maintain professional language. " + last_q
+    elif answer_analysis.get('is_non_english', False):
+        last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "Tell me about yourself."
+        reply = "Please respond in English. " + last_q
+    elif answer_analysis.get('is_clarification_request', False):
+        last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "What are your key skills?"
+        reply = "Sure, let me rephrase. " + last_q
+    else:
+        return None
+    interview_session.conversation_history.append({"role": "user", "content": user_message})
+    interview_session.conversation_history.append({"role": "assistant", "content": reply})
+    return reply
+
+
+def _start_turn(interview_session, user_message, answer_analysis):
+    """Record the candidate's answer and build the Groq messages for the next turn"""
+    # Add user message to history
+    interview_session.conversation_history.append({
+        "role": "user",
+        "content": user_message
+    })
+    interview_session.answers.append(user_message)
+    
+    # Generate smart system prompt and instruction
+    system_prompt = get_smart_system_prompt(interview_session)
+    instruction = get_instruction_for_state(interview_session, user_message, answer_analysis)
+    
+    # Combine system prompt with instruction
+    full_system = f"{system_prompt}\n\nCURRENT INSTRUCTION: {instruction}"
+    
+    return [
+        {"role": "system", "content": full_system},
+        *interview_session.conversation_history[-6:]
+    ]
+
+
+def _finish_turn(interview_session, ai_message, answer_analysis):
+    """Record the interviewer's reply and advance state and difficulty"""
+    interview_session.conversation_history.append({
+        "role": "assistant",
+        "content": ai_message
+    })
+    interview_session.questions_asked.append(ai_message)
+    update_session_state(interview_session, answer_analysis)
+
+
+def _fallback_turn(interview_session, answer_analysis):
+    """Answer with a predefined question when Groq is unavailable"""
+    fallback_response = get_fallback_question(interview_session)
+    interview_session.conversation_history.append({
+        "role": "assistant",
+        "content": fallback_response
+    })
+    update_session_state(interview_session, answer_analysis)
+    return fallback_response
+
+
+def _stream_groq_reply(messages):
+    """Yield the interviewer's reply from Groq piece by piece as it is generated"""
+    api_key = get_groq_key()
+    if not api_key:
+        raise Exception("GROQ_API_KEY not configured")
+    
+    with _http.post(
+        GROQ_API_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "model": "llama-3.1-8b-instant",
+            "messages": messages,
+            "temperature": 0.6,
+            "max_tokens": 200,
+            "stream": True
+        },
+        stream=True,
+        timeout=(AI_CONNECT_TIMEOUT, 15)
+    ) as response:
+        if response.status_code != 200:
+            print(f"Groq API error: {response.status_code} - {response.text[:200]}")
+            raise Exception(f"Groq API error {response.status_code}")
+        
+        # OpenAI-style SSE: "data: {chunk}" lines, terminated by "data: [DONE]"
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            chunk = line[6:]
+            if chunk == b"[DONE]":
+                break
+            delta = json.loads(chunk)["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
+
+
+def _sse(payload, event=None):
+    """Format one Server-Sent Events frame"""
+    frame = f"event: {event}\n" if event else ""
+    return f"{frame}data: {json.dumps(payload)}\n\n"
+
+
 @interview_bp.route('/respond', methods=['POST'])
 def process_response():
     """Process user's response using Groq AI with smart features"""
@@ -371,155 +807,123 @@ def process_response():
         user_message = data.get('message', '')
         
         # Get session
-        if session_id not in active_sessions:
+        interview_session = load_session(session_id)
+        if interview_session is None:
             return jsonify({
                 "success": False,
                 "error": "Session not found",
                 "session_expired": True
             }), 404
         
-        interview_session = active_sessions[session_id]
+        # Every branch below updates the session, so persist it once the response is built
+        @after_this_request
+        def _persist_session(response):
+            try:
+                save_session(interview_session)
+            except Exception as e:
+                print(f"Error saving interview session: {e}")
+            return response
         
         # Analyze user's answer quality
         answer_analysis = interview_session.analyze_answer(user_message)
 
-        # === DIRECT HANDLING: Abusive language ===
-        if answer_analysis.get('is_abusive', False):
-            last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "Tell me about yourself."
-            warning_response = "Please maintain professional language. " + last_q
-            interview_session.conversation_history.append({"role": "user", "content": user_message})
-            interview_session.conversation_history.append({"role": "assistant", "content": warning_response})
-            return jsonify({
-                "success": True,
-                "message": warning_response,
-                "state": interview_session.state,
-                "question_count": interview_session.question_count,
-                "difficulty_level": interview_session.difficulty_level,
-                "should_speak": True
-            })
-
-        # === DIRECT HANDLING: Non-English response ===
-        if answer_analysis.get('is_non_english', False):
-            last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "Tell me about yourself."
-            english_response = "Please respond in English. " + last_q
-            interview_session.conversation_history.append({"role": "user", "content": user_message})
-            interview_session.conversation_history.append({"role": "assistant", "content": english_response})
-            return jsonify({
-                "success": True,
-                "message": english_response,
-                "state": interview_session.state,
-                "question_count": interview_session.question_count,
-                "difficulty_level": interview_session.difficulty_level,
-                "should_speak": True
-            })
-
-        # === DIRECT HANDLING: Clarification request ===
-        if answer_analysis.get('is_clarification_request', False):
-            last_q = interview_session.questions_asked[-1] if interview_session.questions_asked else "What are your key skills?"
-            clarify_response = "Sure, let me rephrase. " + last_q
-            interview_session.conversation_history.append({"role": "user", "content": user_message})
-            interview_session.conversation_history.append({"role": "assistant", "content": clarify_response})
-            return jsonify({
-                "success": True,
-                "message": clarify_response,
-                "state": interview_session.state,
-                "question_count": interview_session.question_count,
-                "difficulty_level": interview_session.difficulty_level,
-                "should_speak": True
-            })
-        
-        # Add user message to history
-        interview_session.conversation_history.append({
-            "role": "user",
-            "content": user_message
-        })
-        interview_session.answers.append(user_message)
-        
-        # Generate smart system prompt and instruction
-        system_prompt = get_smart_system_prompt(interview_session)
-        instruction = get_instruction_for_state(interview_session, user_message, answer_analysis)
+        # === DIRECT HANDLING: Abusive, non-English or clarification ===
+        direct_response = _direct_reply(interview_session, user_message, answer_analysis)
+        if direct_response is not None:
+            return jsonify(_turn_payload(interview_session, direct_response))
         
-        # Combine system prompt with instruction
-        full_system = f"{system_prompt}\n\nCURRENT INSTRUCTION: {instruction}"
+        messages = _start_turn(interview_session, user_message, answer_analysis)
+        cache_key = _reply_cache_key(messages)
         
         try:
-            api_key = get_groq_key()
-            if not api_key:
-                print("❌ No Groq API key, using fallback")
-                raise Exception("GROQ_API_KEY not configured")
-            
-            print(f"🚀 Groq API call (Difficulty: {interview_session.difficulty_level}, Q#{interview_session.question_count})")
-            
-            # Call Groq API (ULTRA FAST ~200-500ms)
-            response = requests.post(
-                GROQ_API_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "llama-3.1-8b-instant",
-                    "messages": [
-                        {"role": "system", "content": full_system},
-                        *interview_session.conversation_history[-6:]
-                    ],
-                    "temperature": 0.6,
-                    "max_tokens": 200
-                },
-                timeout=15
-            )
-            
-            elapsed = int((time.time() - start_time) * 1000)
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_message = result['choices'][0]['message']['content']
+            ai_message = _reply_cache.get(cache_key)
+            if ai_message:
+                print(f"♻️ Reusing cached reply (Difficulty: {interview_session.difficulty_level}, Q#{interview_session.question_count})")
+            else:
+                api_key = get_groq_key()
+                if not api_key:
+                    print("❌ No Groq API key, using fallback")
+                    raise Exception("GROQ_API_KEY not configured")
                 
-                # Clean any weird formatting
-                ai_message = ai_message.strip()
+                print(f"🚀 Groq API call (Difficulty: {interview_session.difficulty_level}, Q#{interview_session.question_count})")
                 
-                # Update conversation history
-                interview_session.conversation_history.append({
-                    "role": "assistant",
-                    "content": ai_message
-                })
-                interview_session.questions_asked.append(ai_message)
+                # Call Groq API (ULTRA FAST ~200-500ms)
+                response = _http.post(
+                    GROQ_API_URL,
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": "llama-3.1-8b-instant",
+                        "messages": messages,
+                        "temperature": 0.6,
+                        "max_tokens": 200
+                    },
+                    timeout=(AI_CONNECT_TIMEOUT, 15)
+                )
                 
-                # Update state and difficulty
-                update_session_state(interview_session, answer_analysis)
+                if response.status_code != 200:
+                    print(f"Groq API error: {response.status_code} - {response.text[:200]}")
+                    raise Exception(f"Groq API error {response.status_code}")
                 
-                print(f"⚡ Groq response in {elapsed}ms")
+                result = response.json()
+                ai_message = result['choices'][0]['message']['content']
                 
-                return jsonify({
-                    "success": True,
-                    "message": ai_message,
-                    "state": interview_session.state,
-                    "question_count": interview_session.question_count,
-                    "difficulty_level": interview_session.difficulty_level,
-                    "should_speak": True
-                })
-            else:
-                print(f"Groq API error: {response.status_code} - {response.text[:200]}")
-                raise Exception(f"Groq API error {response.status_code}")
+                # Clean any weird formatting
+                ai_message = ai_message.strip()
+                if not ai_message:
+                    raise Exception("Groq returned an empty reply")
+                _reply_cache.put(cache_key, ai_message)
+            
+            elapsed = int((time.time() - start_time) * 1000)
+            
+            _finish_turn(interview_session, ai_message, answer_analysis)
+            
+            print(f"⚡ Groq response in {elapsed}ms")
+            
+            return jsonify(_turn_payload(interview_session, ai_message))
         
         except Exception as e:
             print(f"Error calling Groq API: {e}")
             # Fallback to predefined questions
-            fallback_response = get_fallback_question(interview_session)
-            interview_session.conversation_history.append({
-                "role": "assistant",
-                "content": fallback_response
-            })
-            update_session_state(interview_session, answer_analysis)
+            fallback_response = _fallback_turn(interview_session, answer_analysis)
             
+            return jsonify(_turn_payload(interview_session, fallback_response))
+    
+    except Exception as e:
+        print(f"Error processing response: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@interview_bp.route('/respond/stream', methods=['POST'])
+def process_response_stream():
+    """
+    Same turn as /respond, streamed as Server-Sent Events so the candidate sees the
+    interviewer's reply as soon as Groq produces its first tokens.
+    Sends `data: {"delta": ...}` frames with reply text, then one `event: done` frame
+    carrying the /respond JSON body. The done frame's message is authoritative: if
+    Groq fails mid-stream the turn falls back to a predefined question
+    """
+    import time
+    start_time = time.time()
+    
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        user_message = data.get('message', '')
+        
+        interview_session = load_session(session_id)
+        if interview_session is None:
             return jsonify({
-                "success": True,
-                "message": fallback_response,
-                "state": interview_session.state,
-                "question_count": interview_session.question_count,
-                "difficulty_level": interview_session.difficulty_level,
-                "should_speak": True
-            })
+                "success": False,
+                "error": "Session not found",
+                "session_expired": True
+            }), 404
+        
+        answer_analysis = interview_session.analyze_answer(user_message)
     
     except Exception as e:
         print(f"Error processing response: {e}")
@@ -527,6 +931,73 @@ def process_response():
             "success": False,
             "error": str(e)
         }), 500
+    
+    def generate():
+        message = _direct_reply(interview_session, user_message, answer_analysis)
+        if message is not None:
+            yield _sse({"delta": message})
+        else:
+            messages = _start_turn(interview_session, user_message, answer_analysis)
+            cache_key = _reply_cache_key(messages)
+            message = _reply_cache.get(cache_key)
+            if message:
+                yield _sse({"delta": message})
+            else:
+                try:
+                    parts = []
+                    for delta in _stream_groq_reply(messages):
+                        parts.append(delta)
+                        yield _sse({"delta": delta})
+                    message = "".join(parts).strip()
+                    if message:
+                        _reply_cache.put(cache_key, message)
+                except Exception as e:
+                    print(f"Error streaming from Groq API: {e}")
+            
+            if message:
+                _finish_turn(interview_session, message, answer_analysis)
+                print(f"⚡ Groq stream finished in {int((time.time() - start_time) * 1000)}ms")
+            else:
+                message = _fallback_turn(interview_session, answer_analysis)
+        
+        try:
+            save_session(interview_session)
+        except Exception as e:
+            print(f"Error saving interview session: {e}")
+        
+        yield _sse(_turn_payload(interview_session, message), event="done")
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"  # Keep proxies from buffering the stream
+    })
+
+def _repeat_end_response(session_id):
+    """/end response for a session that does not exist or has already been ended"""
+    doc = _sessions_collection().find_one({"_id": session_id}, {"ending": 1, "pending_interview": 1}) if session_id else None
+    if doc is None or "ending" not in doc:
+        return jsonify({
+            "success": False,
+            "error": "Session not found"
+        }), 404
+    
+    # Already ended: hand back the stored result (storing it first if its write
+    # failed), or report that it is still being built
+    interview = _interviews_collection().find_one({"_id": doc["ending"]}, {"feedback": 1})
+    if interview is None and "pending_interview" in doc:
+        interview = _restore_pending_interview(doc)
+    if interview is None:
+        return jsonify({
+            "success": False,
+            "error": "Interview is already being ended",
+            "in_progress": True
+        }), 409
+    return jsonify({
+        "success": True,
+        "interview_id": str(doc["ending"]),
+        "feedback": interview.get("feedback", {})
+    })
+
 
 @interview_bp.route('/end', methods=['POST'])
 def end_interview():
@@ -536,16 +1007,18 @@ def end_interview():
         session_id = data.get('session_id')
         confidence_analysis = data.get('confidence_analysis')  # Client-side MediaPipe results
         
-        if session_id not in active_sessions:
-            return jsonify({
-                "success": False,
-                "error": "Session not found"
-            }), 404
-        
-        interview_session = active_sessions[session_id]
+        # Claim the session so a retried or double-submitted /end cannot run the
+        # feedback analysis (and store the interview) a second time
+        interview_id = ObjectId()
+        interview_session = claim_session_end(session_id, interview_id)
+        if interview_session is None:
+            return _repeat_end_response(session_id)
         
-        # Generate feedback
-        feedback = generate_interview_feedback(interview_session)
+        try:
+            feedback = generate_interview_feedback(interview_session)
+        except Exception:
+            release_session_end(session_id)
+            raise
         
         # Add confidence analysis to feedback if available
         if confidence_analysis and confidence_analysis.get('framesAnalyzed', 0) > 0:
@@ -560,10 +1033,10 @@ def end_interview():
             print(f"📹 Confidence analysis saved: Eye={confidence_analysis.get('avgEyeContact')}%, Stability={confidence_analysis.get('avgHeadStability')}%, Overall={confidence_analysis.get('avgOverall')}%")
         
         # Save to database
-        db = get_db()
         interview_data = {
+            "_id": interview_id,
             **interview_session.to_dict(),
-            "ended_at": datetime.utcnow(),
+            "ended_at": datetime.now(timezone.utc),
             "feedback": feedback,
             "status": "completed"
         }
@@ -572,15 +1045,13 @@ def end_interview():
         if confidence_analysis and confidence_analysis.get('framesAnalyzed', 0) > 0:
             interview_data['confidence_analysis'] = feedback['confidence_analysis']
         
-        result = db.interviews.insert_one(interview_data)
-        interview_id = str(result.inserted_id)
-        
-        # Remove from active sessions
-        del active_sessions[session_id]
+        # The id is generated here, so the record is written off the request path
+        # while the feedback goes straight back
+        _write_executor.submit(_store_completed_interview, interview_data, session_id)
         
         return jsonify({
             "success": True,
-            "interview_id": interview_id,
+            "interview_id": str(interview_id),
             "feedback": feedback
         })
     
@@ -655,12 +1126,12 @@ def transcribe_audio():
             'Authorization': f'Bearer {api_key}'
         }
         
-        response = requests.post(
+        response = _http.post(
             GROQ_AUDIO_API_URL,
             headers=headers,
             files=files,
             data=data,
-            timeout=30
+            timeout=(AI_CONNECT_TIMEOUT, 30)
         )
         
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -784,24 +1255,40 @@ def text_to_speech():
         }), 500
 
 
+def _json_response(payload):
+    """jsonify() equivalent (sorted keys) encoded with orjson when it is installed"""
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+                    mimetype='application/json')
+
+
+def _serialize_interview(interview):
+    """Make a stored interview record JSON-ready in place"""
+    interview['_id'] = str(interview['_id'])
+    # started_at is already stored as an ISO string (see InterviewSession.to_dict);
+    # ended_at is a BSON date, which pymongo returns naive but is UTC
+    for field in ('started_at', 'ended_at'):
+        value = interview.get(field)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            interview[field] = value.isoformat()
+
+
 @interview_bp.route('/history/<phone_number>', methods=['GET'])
 def get_interview_history(phone_number):
     """Get interview history for a user"""
     try:
-        db = get_db()
-        interviews = list(db.interviews.find(
+        interviews = list(_interviews_collection().find(
             {"phone_number": phone_number}
         ).sort("started_at", -1).limit(10))
         
         # Convert ObjectId to string
         for interview in interviews:
-            interview['_id'] = str(interview['_id'])
-            if 'started_at' in interview:
-                interview['started_at'] = interview['started_at'].isoformat()
-            if 'ended_at' in interview:
-                interview['ended_at'] = interview['ended_at'].isoformat()
+            _serialize_interview(interview)
         
-        return jsonify({
+        return _json_response({
             "success": True,
             "interviews": interviews
         })
@@ -817,8 +1304,16 @@ def get_interview_history(phone_number):
 def get_interview_feedback(interview_id):
     """Get feedback for a specific interview"""
     try:
-        db = get_db()
-        interview = db.interviews.find_one({"_id": ObjectId(interview_id)})
+        interview_oid = ObjectId(interview_id)
+        interview = _interviews_collection().find_one({"_id": interview_oid})
+        
+        if not interview:
+            # The record may still be parked on its session after a failed write
+            session_doc = _sessions_collection().find_one(
+                {"ending": interview_oid, "pending_interview": {"$exists": True}}
+            )
+            if session_doc:
+                interview = _restore_pending_interview(session_doc)
         
         if not interview:
             return jsonify({
@@ -826,13 +1321,9 @@ def get_interview_feedback(interview_id):
                 "error": "Interview not found"
             }), 404
         
-        interview['_id'] = str(interview['_id'])
-        if 'started_at' in interview:
-            interview['started_at'] = interview['started_at'].isoformat()
-        if 'ended_at' in interview:
-            interview['ended_at'] = interview['ended_at'].isoformat()
+        _serialize_interview(interview)
         
-        return jsonify({
+        return _json_response({
             "success": True,
             "interview": interview
         })
@@ -932,29 +1423,50 @@ def get_fallback_question(session):
     
     return fallback_questions.get(session.state, "Can you tell me more about that?")
 
+# Vocabulary counted by _analyze_response_quality (substring matches, each term at
+# most once per answer)
+TECHNICAL_KEYWORDS = (
+    'algorithm', 'database', 'api', 'framework', 'architecture', 'deploy', 'testing',
+    'agile', 'scrum', 'git', 'docker', 'kubernetes', 'cloud', 'aws', 'azure',
+    'react', 'node', 'python', 'java', 'sql', 'nosql', 'mongodb', 'rest',
+    'microservice', 'ci/cd', 'pipeline', 'optimization', 'scalab', 'performance',
+    'debug', 'refactor', 'design pattern', 'solid', 'oop', 'functional',
+    'machine learning', 'data structure', 'complexity', 'cache', 'security',
+    'authentication', 'authorization', 'encryption', 'ssl', 'http', 'tcp',
+    'linux', 'server', 'load balancing', 'cdn', 'webpack', 'typescript',
+    'component', 'state management', 'redux', 'context', 'hook', 'middleware'
+)
+
+CASUAL_PHRASES = (
+    'i guess', 'maybe', 'i think so', 'not sure', 'i don\'t know',
+    'whatever', 'stuff like that', 'you know', 'kind of', 'sort of',
+    'um', 'uh', 'like yeah', 'basically'
+)
+
+
+def _build_term_automaton(terms):
+    """Aho-Corasick automaton reporting each term it finds"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_terms(automaton, text):
+    """Same as sum(1 for term in terms if term in text)"""
+    return len({term for _, term in automaton.iter(text)})
+
+
+_TECHNICAL_KEYWORD_AUTOMATON = _build_term_automaton(TECHNICAL_KEYWORDS)
+_CASUAL_PHRASE_AUTOMATON = _build_term_automaton(CASUAL_PHRASES)
+
+
 def _analyze_response_quality(answers):
     """Analyze the quality of candidate responses"""
     if not answers:
         return {"avg_length": 0, "detail_score": 0, "technical_keywords": 0, "casual_count": 0}
     
-    technical_keywords = [
-        'algorithm', 'database', 'api', 'framework', 'architecture', 'deploy', 'testing',
-        'agile', 'scrum', 'git', 'docker', 'kubernetes', 'cloud', 'aws', 'azure',
-        'react', 'node', 'python', 'java', 'sql', 'nosql', 'mongodb', 'rest',
-        'microservice', 'ci/cd', 'pipeline', 'optimization', 'scalab', 'performance',
-        'debug', 'refactor', 'design pattern', 'solid', 'oop', 'functional',
-        'machine learning', 'data structure', 'complexity', 'cache', 'security',
-        'authentication', 'authorization', 'encryption', 'ssl', 'http', 'tcp',
-        'linux', 'server', 'load balancing', 'cdn', 'webpack', 'typescript',
-        'component', 'state management', 'redux', 'context', 'hook', 'middleware'
-    ]
-    
-    casual_phrases = [
-        'i guess', 'maybe', 'i think so', 'not sure', 'i don\'t know',
-        'whatever', 'stuff like that', 'you know', 'kind of', 'sort of',
-        'um', 'uh', 'like yeah', 'basically'
-    ]
-    
     total_length = 0
     tech_count = 0
     casual_count = 0
@@ -962,12 +1474,8 @@ def _analyze_response_quality(answers):
     for answer in answers:
         answer_lower = answer.lower()
         total_length += len(answer.split())
-        for kw in technical_keywords:
-            if kw in answer_lower:
-                tech_count += 1
-        for phrase in casual_phrases:
-            if phrase in answer_lower:
-                casual_count += 1
+        tech_count += _count_terms(_TECHNICAL_KEYWORD_AUTOMATON, answer_lower)
+        casual_count += _count_terms(_CASUAL_PHRASE_AUTOMATON, answer_lower)
     
     avg_length = total_length / len(answers) if answers else 0
     detail_score = min(100, (avg_length / 30) * 100)  # 30 words = 100%
@@ -1017,39 +1525,86 @@ def _get_performance_level(score):
         return {"level": "Unsatisfactory", "emoji": "⚠️", "description": "Performance well below expectations"}
 
 
+# Scorecard categories in display order: (key, icon, description)
+SCORECARD_CATEGORIES = (
+    ('technical_knowledge', '💻', 'Understanding of technical concepts and tools'),
+    ('communication', '🗣️', 'Clarity, articulation, and expression'),
+    ('problem_solving', '🧩', 'Analytical thinking and approach to challenges'),
+    ('professionalism', '👔', 'Professional demeanor and workplace readiness'),
+    ('enthusiasm', '🔥', 'Passion and interest in the role'),
+    ('confidence', '💪', 'Self-assurance and composure')
+)
+
+
+def _score_level(bucket):
+    """Level and color for a score in [bucket * 10, bucket * 10 + 9]"""
+    if bucket >= 8:
+        return "Excellent", "green"
+    elif bucket >= 6:
+        return "Good", "blue"
+    elif bucket >= 4:
+        return "Fair", "yellow"
+    return "Needs Work", "red"
+
+
+# Level/color per score decile (index 10 is a perfect 100), built once at import
+_SCORE_LEVEL_TABLE = tuple(_score_level(bucket) for bucket in range(11))
+
+# Practice tips per category, suggested when that category scores below 70
+CATEGORY_TIPS = (
+    ('technical_knowledge', (
+        "Practice explaining technical concepts in simple terms",
+        "Review common data structures and algorithms",
+        "Build small projects to demonstrate hands-on experience"
+    )),
+    ('communication', (
+        "Use the STAR method (Situation, Task, Action, Result) for behavioral questions",
+        "Practice speaking clearly and at a measured pace",
+        "Prepare 2-3 stories that showcase different skills"
+    )),
+    ('problem_solving', (
+        "Walk through your thought process out loud when solving problems",
+        "Practice breaking complex problems into smaller steps",
+        "Review problem-solving frameworks and apply them consistently"
+    )),
+    ('professionalism', (
+        "Research the company thoroughly before the interview",
+        "Prepare thoughtful questions for the interviewer",
+        "Dress appropriately and maintain good posture"
+    )),
+    ('enthusiasm', (
+        "Show genuine interest by connecting your experience to the role",
+        "Express excitement about specific aspects of the company or position",
+        "Ask engaging follow-up questions"
+    )),
+    ('confidence', (
+        "Practice common interview questions to build confidence",
+        "Record yourself and review your body language",
+        "Remember: it's okay to take a moment to think before answering"
+    ))
+)
+
+GENERAL_TIPS = (
+    "Continue refining your interview skills with regular practice",
+    "Stay updated with industry trends and technologies",
+    "Consider mock interviews with peers for additional feedback"
+)
+
+MAX_TIPS = 6
+
+
 def _generate_scorecard(scores):
     """Generate scorecard with categories like the original project"""
-    category_info = {
-        'technical_knowledge': {'icon': '💻', 'description': 'Understanding of technical concepts and tools'},
-        'communication': {'icon': '🗣️', 'description': 'Clarity, articulation, and expression'},
-        'problem_solving': {'icon': '🧩', 'description': 'Analytical thinking and approach to challenges'},
-        'professionalism': {'icon': '👔', 'description': 'Professional demeanor and workplace readiness'},
-        'enthusiasm': {'icon': '🔥', 'description': 'Passion and interest in the role'},
-        'confidence': {'icon': '💪', 'description': 'Self-assurance and composure'}
-    }
-    
     categories = []
-    for key, info in category_info.items():
+    for key, icon, description in SCORECARD_CATEGORIES:
         score = scores.get(key, 50)
-        if score >= 80:
-            level = "Excellent"
-            color = "green"
-        elif score >= 60:
-            level = "Good"
-            color = "blue"
-        elif score >= 40:
-            level = "Fair"
-            color = "yellow"
-        else:
-            level = "Needs Work"
-            color = "red"
-        
+        level, color = _SCORE_LEVEL_TABLE[min(max(int(score) // 10, 0), 10)]
         categories.append({
             "name": key.replace('_', ' ').title(),
             "key": key,
             "score": score,
-            "icon": info['icon'],
-            "description": info['description'],
+            "icon": icon,
+            "description": description,
             "level": level,
             "color": color
         })
@@ -1060,63 +1615,146 @@ def _generate_scorecard(scores):
 def _generate_tips(scores):
     """Generate personalized tips based on scores"""
     tips = []
-    
-    if scores.get('technical_knowledge', 50) < 70:
-        tips.extend([
-            "Practice explaining technical concepts in simple terms",
-            "Review common data structures and algorithms",
-            "Build small projects to demonstrate hands-on experience"
-        ])
-    
-    if scores.get('communication', 50) < 70:
-        tips.extend([
-            "Use the STAR method (Situation, Task, Action, Result) for behavioral questions",
-            "Practice speaking clearly and at a measured pace",
-            "Prepare 2-3 stories that showcase different skills"
-        ])
-    
-    if scores.get('problem_solving', 50) < 70:
-        tips.extend([
-            "Walk through your thought process out loud when solving problems",
-            "Practice breaking complex problems into smaller steps",
-            "Review problem-solving frameworks and apply them consistently"
-        ])
-    
-    if scores.get('professionalism', 50) < 70:
-        tips.extend([
-            "Research the company thoroughly before the interview",
-            "Prepare thoughtful questions for the interviewer",
-            "Dress appropriately and maintain good posture"
-        ])
-    
-    if scores.get('enthusiasm', 50) < 70:
-        tips.extend([
-            "Show genuine interest by connecting your experience to the role",
-            "Express excitement about specific aspects of the company or position",
-            "Ask engaging follow-up questions"
-        ])
-    
-    if scores.get('confidence', 50) < 70:
-        tips.extend([
-            "Practice common interview questions to build confidence",
-            "Record yourself and review your body language",
-            "Remember: it's okay to take a moment to think before answering"
-        ])
+    for key, category_tips in CATEGORY_TIPS:
+        if scores.get(key, 50) < 70:
+            tips.extend(category_tips)
+            if len(tips) >= MAX_TIPS:
+                break
     
     if not tips:
-        tips = [
-            "Continue refining your interview skills with regular practice",
-            "Stay updated with industry trends and technologies",
-            "Consider mock interviews with peers for additional feedback"
-        ]
+        return list(GENERAL_TIPS)
     
-    return tips[:6]  # Max 6 tips
+    return tips[:MAX_TIPS]
+
+
+# Sections the AI analysis may leave out, and what to report instead
+AI_ANALYSIS_DEFAULTS = {
+    'strengths': ["Participated in the interview"],
+    'improvements': ["Provide more detailed responses"],
+    'knowledge_assessment': {
+        "demonstrated_skills": [], "skill_gaps": [], "depth_of_knowledge": "shallow"
+    },
+    'communication_feedback': {
+        "clarity": "Needs assessment", "structure": "Needs assessment", "vocabulary": "Needs assessment"
+    },
+    'interviewer_guidance': {
+        "hiring_recommendation": "Maybe",
+        "reasoning": "Needs further evaluation",
+        "follow_up_areas": []
+    },
+    'detailed_feedback': ''
+}
+
+
+def _ai_analysis_section(ai_analysis, key):
+    """Section of the AI analysis, or a fresh copy of its default when the model omitted it"""
+    if key in ai_analysis:
+        return ai_analysis[key]
+    return copy.deepcopy(AI_ANALYSIS_DEFAULTS[key])
+
+
+# Fallback clarity/structure feedback by average answer length; callers take a
+# copy since the feedback is stored and returned as plain dicts
+FALLBACK_COMMUNICATION_FEEDBACK = {
+    "brief": {"clarity": "Needs improvement - responses were brief", "structure": "Could be more structured"},
+    "adequate": {"clarity": "Good", "structure": "Could be more structured"},
+    "detailed": {"clarity": "Good", "structure": "Adequate"}
+}
+
+
+def _fallback_scores(quality, penalty=0):
+    """Heuristic category scores from response quality metrics, used when AI analysis is unavailable"""
+    avg_length = quality['avg_length']
+    base_score = 50
+    if avg_length > 25:
+        base_score += 15
+    elif avg_length > 15:
+        base_score += 8
+    elif avg_length < 8:
+        base_score -= 15
+    
+    tech_bonus = min(20, quality['technical_keywords'] * 3)
+    casual_penalty = min(15, quality['casual_count'] * 5)
+    
+    scores = {
+        'technical_knowledge': max(15, min(85, base_score + tech_bonus - 5)),
+        'communication': max(15, min(85, base_score + 5 - casual_penalty)),
+        'problem_solving': max(15, min(85, base_score - 5 + tech_bonus // 2)),
+        'professionalism': max(15, min(85, base_score - casual_penalty)),
+        'enthusiasm': max(15, min(85, base_score + 5)),
+        'confidence': max(15, min(85, base_score))
+    }
+    
+    # Early termination penalty, never below 10
+    if penalty:
+        for key in scores:
+            scores[key] = max(10, scores[key] - penalty)
+    
+    return scores
+
+
+def _select_feedback_model(quality, questions_answered):
+    """Use the detailed model only where there is enough technical content to evaluate"""
+    if questions_answered < 4 or quality['avg_length'] < 12 or quality['technical_keywords'] < 2:
+        return FEEDBACK_MODEL
+    return FEEDBACK_MODEL_DETAILED
+
+
+def _request_feedback_analysis(api_key, model, analysis_prompt):
+    """Ask Perplexity to evaluate the interview; returns the parsed analysis or None"""
+    ai_analysis = None
+    
+    print(f"[Interview Feedback] Calling Perplexity API ({model}) for analysis...")
+    
+    response = _http.post(
+        PERPLEXITY_API_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "model": model,
+            "messages": [
+                {"role": "system", "content": "You are an expert interview evaluator. Respond ONLY with valid JSON, no markdown, no code blocks, no explanation."},
+                {"role": "user", "content": analysis_prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 1000,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"schema": FEEDBACK_RESPONSE_SCHEMA}
+            }
+        },
+        timeout=(AI_CONNECT_TIMEOUT, 45)
+    )
+    
+    if response.status_code == 200:
+        result = response.json()
+        ai_text = result['choices'][0]['message']['content'].strip()
+        
+        # Structured output makes the reply a bare JSON object; if a model still
+        # wraps it (markdown fences, preamble), fall back to the outermost {...}
+        try:
+            ai_analysis = json.loads(ai_text)
+        except ValueError:
+            json_start = ai_text.find('{')
+            json_end = ai_text.rfind('}')
+            if json_start != -1 and json_end > json_start:
+                ai_analysis = json.loads(ai_text[json_start:json_end + 1])
+        if ai_analysis is not None:
+            print(f"[Interview Feedback] AI analysis successful: scores={ai_analysis.get('scores', {})}")
+        else:
+            print(f"[Interview Feedback] Could not find JSON in AI response: {ai_text[:200]}")
+    else:
+        print(f"[Interview Feedback] Perplexity API error: {response.status_code}")
+    
+    return ai_analysis
 
 
 def generate_interview_feedback(session):
     """Generate comprehensive AI-powered feedback for completed interview"""
     
-    duration_minutes = round((datetime.utcnow() - session.started_at).total_seconds() / 60, 1)
+    duration_minutes = round((datetime.now(timezone.utc) - session.started_at).total_seconds() / 60, 1)
     questions_answered = len(session.answers)
     quality = _analyze_response_quality(session.answers)
     
@@ -1137,10 +1775,13 @@ def generate_interview_feedback(session):
             "penalty": 15
         }
     
-    # Try AI-powered analysis using Perplexity
+    # Try AI-powered analysis using Perplexity. Interviews abandoned before 3 answers
+    # skip it and get the rule-based feedback: there is too little transcript to
+    # analyze and the high early-termination penalty dominates the scores anyway
     ai_analysis = None
+    skip_ai = early_termination is not None and early_termination['severity'] == 'high'
     try:
-        api_key = get_perplexity_key()
+        api_key = None if skip_ai else get_perplexity_key()
         if api_key and session.conversation_history:
             # Build conversation summary
             conv_text = ""
@@ -1204,48 +1845,9 @@ You MUST respond in EXACTLY this JSON format (no other text):
   "detailed_feedback": "<2-3 sentence overall assessment>"
 }}"""
 
-            print(f"[Interview Feedback] Calling Perplexity API for analysis...")
-            
-            response = requests.post(
-                PERPLEXITY_API_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "sonar",
-                    "messages": [
-                        {"role": "system", "content": "You are an expert interview evaluator. Respond ONLY with valid JSON, no markdown, no code blocks, no explanation."},
-                        {"role": "user", "content": analysis_prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 1000
-                },
-                timeout=45
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_text = result['choices'][0]['message']['content'].strip()
-                
-                # Clean up response - remove markdown code blocks if present
-                if ai_text.startswith('```'):
-                    ai_text = ai_text.split('\n', 1)[1] if '\n' in ai_text else ai_text[3:]
-                if ai_text.endswith('```'):
-                    ai_text = ai_text[:-3]
-                ai_text = ai_text.strip()
-                
-                # Try to extract JSON from the response
-                import re
-                json_match = re.search(r'\{[\s\S]*\}', ai_text)
-                if json_match:
-                    ai_analysis = json.loads(json_match.group())
-                    print(f"[Interview Feedback] AI analysis successful: scores={ai_analysis.get('scores', {})}")
-                else:
-                    print(f"[Interview Feedback] Could not find JSON in AI response: {ai_text[:200]}")
-            else:
-                print(f"[Interview Feedback] Perplexity API error: {response.status_code}")
-                
+            model = _select_feedback_model(quality, questions_answered)
+            ai_analysis = _request_feedback_analysis(api_key, model, analysis_prompt)
+    
     except Exception as e:
         print(f"[Interview Feedback] AI analysis failed: {e}")
         import traceback
@@ -1288,47 +1890,17 @@ You MUST respond in EXACTLY this JSON format (no other text):
         overall_score = _calculate_weighted_score(scores)
         performance_level = _get_performance_level(overall_score)
         
-        strengths = ai_analysis.get('strengths', ["Participated in the interview"])
-        improvements = ai_analysis.get('improvements', ["Provide more detailed responses"])
-        knowledge_assessment = ai_analysis.get('knowledge_assessment', {
-            "demonstrated_skills": [], "skill_gaps": [], "depth_of_knowledge": "shallow"
-        })
-        communication_feedback = ai_analysis.get('communication_feedback', {
-            "clarity": "Needs assessment", "structure": "Needs assessment", "vocabulary": "Needs assessment"
-        })
-        interviewer_guidance = ai_analysis.get('interviewer_guidance', {
-            "hiring_recommendation": "Maybe",
-            "reasoning": "Needs further evaluation",
-            "follow_up_areas": []
-        })
-        detailed_feedback = ai_analysis.get('detailed_feedback', '')
+        strengths = _ai_analysis_section(ai_analysis, 'strengths')
+        improvements = _ai_analysis_section(ai_analysis, 'improvements')
+        knowledge_assessment = _ai_analysis_section(ai_analysis, 'knowledge_assessment')
+        communication_feedback = _ai_analysis_section(ai_analysis, 'communication_feedback')
+        interviewer_guidance = _ai_analysis_section(ai_analysis, 'interviewer_guidance')
+        detailed_feedback = _ai_analysis_section(ai_analysis, 'detailed_feedback')
         
     else:
         # Fallback: generate basic scores from response quality metrics
-        base_score = 50
-        if quality['avg_length'] > 25:
-            base_score += 15
-        elif quality['avg_length'] > 15:
-            base_score += 8
-        elif quality['avg_length'] < 8:
-            base_score -= 15
-        
-        tech_bonus = min(20, quality['technical_keywords'] * 3)
-        casual_penalty = min(15, quality['casual_count'] * 5)
-        
-        scores = {
-            'technical_knowledge': max(15, min(85, base_score + tech_bonus - 5)),
-            'communication': max(15, min(85, base_score + 5 - casual_penalty)),
-            'problem_solving': max(15, min(85, base_score - 5 + tech_bonus // 2)),
-            'professionalism': max(15, min(85, base_score - casual_penalty)),
-            'enthusiasm': max(15, min(85, base_score + 5)),
-            'confidence': max(15, min(85, base_score))
-        }
-        
-        if early_termination:
-            penalty = early_termination['penalty']
-            for key in scores:
-                scores[key] = max(10, scores[key] - penalty)
+        penalty = early_termination['penalty'] if early_termination else 0
+        scores = _fallback_scores(quality, penalty)
         
         overall_score = _calculate_weighted_score(scores)
         performance_level = _get_performance_level(overall_score)
@@ -1363,11 +1935,16 @@ You MUST respond in EXACTLY this JSON format (no other text):
             "skill_gaps": ["Unable to fully assess without AI analysis"],
             "depth_of_knowledge": "moderate" if quality['technical_keywords'] > 3 else "shallow"
         }
-        communication_feedback = {
-            "clarity": "Good" if quality['avg_length'] > 15 else "Needs improvement - responses were brief",
-            "structure": "Adequate" if quality['avg_length'] > 20 else "Could be more structured",
-            "vocabulary": "Professional" if quality['casual_count'] < 2 else "Could be more formal"
-        }
+        if quality['avg_length'] > 20:
+            length_bucket = "detailed"
+        elif quality['avg_length'] > 15:
+            length_bucket = "adequate"
+        else:
+            length_bucket = "brief"
+        communication_feedback = dict(
+            FALLBACK_COMMUNICATION_FEEDBACK[length_bucket],
+            vocabulary="Professional" if quality['casual_count'] < 2 else "Could be more formal"
+        )
         interviewer_guidance = {
             "hiring_recommendation": "Hire" if overall_score >= 75 else "Maybe" if overall_score >= 55 else "No Hire",
             "reasoning": f"Candidate scored {overall_score}/100 overall. {'Strong candidate with good potential.' if overall_score >= 70 else 'Needs further evaluation in key areas.'}",